@@ -14,6 +14,7 @@ from .connection_credentials import (
     DEFAULT_TIMEOUT,
     HEALTH_CHECK_TIMEOUT,
     GENERATION_TIMEOUT,
+    CONNECT_TIMEOUT,
     DEFAULT_MAX_TOKENS,
     DEFAULT_TEMPERATURE,
     validate_connection_url,
@@ -29,6 +30,7 @@ __all__ = [
     'DEFAULT_TIMEOUT',
     'HEALTH_CHECK_TIMEOUT',
     'GENERATION_TIMEOUT',
+    'CONNECT_TIMEOUT',
     'DEFAULT_MAX_TOKENS',
     'DEFAULT_TEMPERATURE',
     'validate_connection_url',
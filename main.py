@@ -15,7 +15,6 @@ from crewai import Crew, Process
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.agents import create_archivist_agent, create_shadow_agent, create_nexus_agent
 from src.tasks import create_market_analysis_tasks
 from src.llm import create_standard_llm, ModelConfig
 from src.company_profile import CompanyProfile, run_questionnaire
@@ -31,6 +30,7 @@ def setup_environment():
     if os.path.exists(env_file):
         print(f"✅ Loading environment variables from {env_file}")
         load_dotenv(env_file)
+        ModelConfig.invalidate_providers()
         
         # Check if web search keys were loaded successfully
         if os.getenv("SERPER_API_KEY") and os.getenv("FIRECRAWL_API_KEY"):
@@ -46,6 +46,7 @@ def setup_environment():
         # Set API keys from Colab Secrets
         os.environ["SERPER_API_KEY"] = userdata.get("SERPER_API_KEY")
         os.environ["FIRECRAWL_API_KEY"] = userdata.get("FIRECRAWL_API_KEY")
+        ModelConfig.invalidate_providers()
         
     except ImportError:
         print("⚠️  Running locally - checking environment variables")
@@ -158,19 +159,17 @@ def create_personalized_crew(company_profile: CompanyProfile):
     # Create context injector for personalization
     context_injector = create_context_injector(company_profile)
     
-    # Create agents with company context
-    print(f"👥 Creating agents specialized for {company_profile.company_name}...")
-    archivist = create_archivist_agent()
-    shadow = create_shadow_agent()
-    nexus = create_nexus_agent()
-    
     # Create optimized tasks with company context
     print(f"📋 Creating tasks focused on {company_profile.industry}...")
-    tasks = create_market_analysis_tasks()
+    tasks = list(create_market_analysis_tasks())
+    
+    # Agents the tasks run on (concurrent tasks each have their own instance)
+    print(f"👥 Creating agents specialized for {company_profile.company_name}...")
+    agents = list({id(task.agent): task.agent for task in tasks}.values())
     
     # Create crew
     crew = Crew(
-        agents=[archivist, shadow, nexus],
+        agents=agents,
         tasks=tasks,
         process=Process.sequential,
         verbose=True
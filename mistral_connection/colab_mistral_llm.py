@@ -7,13 +7,61 @@ Custom LLM wrapper for Colab-hosted Mistral model to work with CrewAI.
 
 import sys
 import os
-from typing import Dict, Any, List
+import asyncio
+import threading
+import re
+import hashlib
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Union
+import requests
 from crewai.llm import LLM
-from scripts.local_mistral_client import ColabMistralClient
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+# Exact-match response cache settings (deterministic generations only)
+RESPONSE_CACHE_MAXSIZE = 512
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.1
+
+# Default number of concurrent requests issued by generate_batch()
+DEFAULT_BATCH_CONCURRENCY = 10
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
+
+
+@dataclass(frozen=True)
+class GenerationError:
+    """
+    Failed generation returned by ColabMistralLLM.generate()
+    
+    Callers can isinstance-check this instead of substring-matching the
+    response text; str() yields the user-facing apology message.
+    """
+    message: str
+    
+    def __str__(self) -> str:
+        return (
+            "I apologize, but I'm currently unable to process this request due to "
+            f"a connection issue with the AI model. Error: {self.message}"
+        )
+
+
+class _InflightCall:
+    """A generate() request other threads with the same prompt can wait on"""
+    
+    __slots__ = ("done", "result")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Union[str, GenerationError, None] = None
+
 
 class ColabMistralLLM(LLM):
     """
@@ -21,18 +69,31 @@ class ColabMistralLLM(LLM):
     without requiring OpenAI API compatibility
     """
     
-    def __init__(self, temperature: float = 0.7, max_tokens: int = 2048):
+    def __init__(self, temperature: float = 0.7, max_tokens: int = 2048,
+                 strict_cache_keys: bool = False):
         """
         Initialize the Colab Mistral LLM wrapper
         
         Args:
             temperature: Sampling temperature for text generation
             max_tokens: Maximum tokens to generate
+            strict_cache_keys: Key the response cache on the verbatim prompt
+                instead of the whitespace-normalized one
         """
         # Call parent constructor with model name
         super().__init__(model="custom/mistral-7b-instruct-v0.3")
         
-        self.client = ColabMistralClient()
+        # Imported lazily so importing this module doesn't pull in the HTTP client stack
+        from scripts.local_mistral_client import ColabMistralClient, shared_session, json_dumps
+        
+        self._json_dumps = json_dumps
+        
+        # One long-lived keep-alive session shared by every LLM and client in the process
+        self._session = shared_session()
+        self.client = ColabMistralClient(session=self._session)
+        # Opt-in, like ModelConfig's provider pre-warm
+        if os.getenv('LLM_PREWARM') == '1':
+            self._prewarm()
         self.temperature = temperature
         self.max_tokens = max_tokens
         
@@ -51,12 +112,34 @@ class ColabMistralLLM(LLM):
         self.verbose = True
         self.max_retries = 3
         self.timeout = 30
+        
+        # Exact-match response cache (prompt, max_tokens, temperature) -> response
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._strict_cache_keys = strict_cache_keys
+        # generate_batch() calls generate() from several threads at once
+        self._cache_lock = threading.Lock()
+        
+        # Single-flight: request key -> in-flight call shared by identical requests
+        self._inflight: Dict[str, "_InflightCall"] = {}
+        self._inflight_lock = threading.Lock()
+    
+    def _prewarm(self) -> None:
+        """Open the tunnel connection in the background before the first generate()"""
+        def _head():
+            try:
+                self._session.head(self.client.base_url, timeout=2)
+            except Exception:
+                pass
+        
+        threading.Thread(target=_head, daemon=True).start()
     
     def health_check(self) -> Dict[str, Any]:
         """Check if the API server is healthy"""
         return self.client.health_check()
     
-    def generate(self, messages, **kwargs) -> str:
+    def generate(self, messages, **kwargs) -> Union[str, GenerationError]:
         """
         Generate text using the remote Mistral model
         
@@ -65,60 +148,187 @@ class ColabMistralLLM(LLM):
             **kwargs: Additional generation parameters
                 
         Returns:
-            Generated text response
+            Generated text response, or GenerationError if the request failed
         """
+        # Handle different input formats
+        if isinstance(messages, list):
+            # Extract content from chat messages format
+            prompt = ""
+            for msg in messages:
+                if isinstance(msg, dict) and 'content' in msg:
+                    prompt += f"{msg.get('role', 'user')}: {msg['content']}\n"
+                else:
+                    prompt += str(msg) + "\n"
+        elif isinstance(messages, str):
+            prompt = messages
+        else:
+            prompt = str(messages)
+        
+        # Extract parameters with defaults
+        max_tokens = kwargs.get('max_tokens', self.max_tokens)
+        temperature = kwargs.get('temperature', self.temperature)
+        
+        key = self._cache_key(prompt, max_tokens, temperature)
+        
+        # Only deterministic generations are safe to serve from cache
+        cacheable = temperature <= RESPONSE_CACHE_MAX_TEMPERATURE
+        if cacheable:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+        
+        # Identical concurrent requests share one HTTP call
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _InflightCall()
+        
+        if not leader:
+            call.done.wait()
+            return call.result
+        
+        try:
+            call.result = self._generate_remote(prompt, max_tokens, temperature)
+            if cacheable and isinstance(call.result, str):
+                self._cache_put(key, call.result)
+        except Exception as e:
+            # Waiters get a typed error rather than None; the leader re-raises
+            call.result = GenerationError(message=str(e))
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+        return call.result
+    
+    def _generate_remote(self, prompt: str, max_tokens: int, temperature: float) -> Union[str, GenerationError]:
+        """Issue one generation request to the Colab server"""
         try:
-            # Handle different input formats
-            if isinstance(messages, list):
-                # Extract content from chat messages format
-                prompt = ""
-                for msg in messages:
-                    if isinstance(msg, dict) and 'content' in msg:
-                        prompt += f"{msg.get('role', 'user')}: {msg['content']}\n"
-                    else:
-                        prompt += str(msg) + "\n"
-            elif isinstance(messages, str):
-                prompt = messages
-            else:
-                prompt = str(messages)
-            
-            # Extract parameters with defaults
-            max_tokens = kwargs.get('max_tokens', self.max_tokens)
-            temperature = kwargs.get('temperature', self.temperature)
-            
             result = self.client.generate_text(
                 prompt=prompt,
                 max_tokens=max_tokens,
                 temperature=temperature
             )
+        except (requests.RequestException, KeyError, ValueError) as e:
+            logger.exception("Error generating text")
+            return GenerationError(message=str(e))
+        
+        if "response" in result:
+            return result["response"]
+        if "error" in result:
+            logger.error("Model error: %s", result["error"])
+            return GenerationError(message=f"Model error: {result['error']}")
+        return str(result)
+    
+    async def _agenerate(self, semaphore: asyncio.Semaphore, prompt, **kwargs) -> str:
+        """Run one generate() call on a worker thread under the concurrency limit"""
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: self.generate(prompt, **kwargs))
+    
+    async def agenerate_batch(self, prompts: List[Any],
+                              max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+                              **kwargs) -> List[Union[str, GenerationError]]:
+        """
+        Generate responses for several independent prompts concurrently
+        
+        Args:
+            prompts: Prompts or chat message lists
+            max_concurrency: Maximum number of in-flight requests
+            **kwargs: Generation parameters applied to every prompt
             
-            if "response" in result:
-                return result["response"]
-            elif "error" in result:
-                raise Exception(f"Model error: {result['error']}")
-            else:
-                return str(result)
-                
-        except Exception as e:
-            print(f"Error generating text: {e}")
-            return f"I apologize, but I'm currently unable to process this request due to a connection issue with the AI model. Error: {str(e)}"
+        Returns:
+            Responses in the same order as prompts; a prompt whose generate()
+            raised yields the exception instead of cancelling the batch
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await asyncio.gather(
+            *[self._agenerate(semaphore, prompt, **kwargs) for prompt in prompts],
+            return_exceptions=True
+        )
+    
+    def generate_batch(self, prompts: List[Any],
+                       max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+                       **kwargs) -> List[Union[str, GenerationError]]:
+        """
+        Synchronous wrapper around agenerate_batch()
+        
+        Requests overlap on the shared keep-alive pool, so N prompts cost
+        roughly one round-trip instead of N. Must not be called from inside
+        a running event loop; use agenerate_batch() there.
+        
+        Args:
+            prompts: Prompts or chat message lists
+            max_concurrency: Maximum number of in-flight requests
+            **kwargs: Generation parameters applied to every prompt
+            
+        Returns:
+            Responses in the same order as prompts
+        """
+        return asyncio.run(self.agenerate_batch(prompts, max_concurrency=max_concurrency, **kwargs))
+    
+    def _cache_key(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """Build a stable cache key for a generation request"""
+        if not self._strict_cache_keys:
+            # Trailing newlines and doubled spaces shouldn't cause cache misses
+            prompt = _WHITESPACE_RE.sub(" ", prompt.strip())
+        # Fixed field order, so no key sorting is needed for a stable encoding
+        payload = self._json_dumps([prompt, max_tokens, temperature])
+        return hashlib.sha256(payload).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Look up a cached response and refresh its LRU position"""
+        with self._cache_lock:
+            response = self._response_cache.get(key)
+            if response is None:
+                self._misses += 1
+                return None
+            self._response_cache.move_to_end(key)
+            self._hits += 1
+            return response
+    
+    def _cache_put(self, key: str, response: str) -> None:
+        """Store a response, evicting the oldest entry past the size limit"""
+        with self._cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_MAXSIZE:
+                self._response_cache.popitem(last=False)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache statistics"""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "size": len(self._response_cache),
+            "maxsize": RESPONSE_CACHE_MAXSIZE
+        }
+    
+    def close(self) -> None:
+        """Release the pooled HTTP connections"""
+        self._session.close()
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the loaded model"""
-        return self.client.get_model_info()
+        info = dict(self.client.get_model_info())  # copy: the client caches its result
+        info["response_cache"] = self.get_cache_stats()
+        return info
     
-    # CrewAI compatibility methods
+    # CrewAI compatibility methods (a GenerationError becomes its apology text)
     def __call__(self, messages, **kwargs) -> str:
         """Make the class callable for CrewAI compatibility"""
-        return self.generate(messages, **kwargs)
+        return str(self.generate(messages, **kwargs))
     
     def _call(self, prompt: str, **kwargs) -> str:
         """Internal method called by CrewAI framework"""
-        return self.generate(prompt, **kwargs)
+        return str(self.generate(prompt, **kwargs))
     
     def invoke(self, input_data, **kwargs) -> str:
         """CrewAI invoke method compatibility"""
-        return self.generate(input_data, **kwargs)
+        return str(self.generate(input_data, **kwargs))
     
     def completion(self, messages, **kwargs):
         """LiteLLM-style completion method"""
@@ -126,7 +336,7 @@ class ColabMistralLLM(LLM):
         # Return in LiteLLM format
         return type('MockResponse', (), {
             'choices': [type('Choice', (), {
-                'message': type('Message', (), {'content': response})()
+                'message': type('Message', (), {'content': str(response)})()
             })()]
         })()
     
@@ -168,12 +378,17 @@ def test_colab_mistral_llm() -> bool:
         # Test LLM creation
         llm = create_colab_mistral_llm()
         
-        # Test health check
-        health = llm.health_check()
+        # Health check and generation are independent, so overlap their round-trips
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            health_future = executor.submit(llm.health_check)
+            result = llm.generate("Test message: Hello!")
+            health = health_future.result()
         print(f"✅ Health check: {health}")
         
         # Test basic generation
-        result = llm.generate("Test message: Hello!")
+        if isinstance(result, GenerationError):
+            print(f"❌ LLM test failed: {result.message}")
+            return False
         print(f"✅ LLM test successful: {result[:50]}...")
         return True
         
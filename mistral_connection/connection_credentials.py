@@ -62,6 +62,10 @@ DEFAULT_TIMEOUT = 60
 HEALTH_CHECK_TIMEOUT = 10
 GENERATION_TIMEOUT = 30
 
+# TCP connect budget, separate from the read timeouts above so a dead tunnel
+# fails fast instead of waiting out a full read timeout
+CONNECT_TIMEOUT = 3.05
+
 # Default generation parameters
 DEFAULT_MAX_TOKENS = 512
 DEFAULT_TEMPERATURE = 0.5
@@ -103,6 +107,7 @@ def get_connection_info():
         "headers": LOCALTUNNEL_HEADERS,
         "timeouts": {
             "default": DEFAULT_TIMEOUT,
+            "connect": CONNECT_TIMEOUT,
             "health": HEALTH_CHECK_TIMEOUT,
             "generation": GENERATION_TIMEOUT
         }
@@ -8,40 +8,168 @@ Client for connecting to Colab-hosted Mistral model via HTTP API.
 import requests
 import json
 import time
+import threading
+from functools import lru_cache
 from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config.connection_credentials import (
     COLAB_MISTRAL_URL,
     HEALTH_ENDPOINT,
     GENERATE_ENDPOINT,
     MODEL_INFO_ENDPOINT,
     LOCALTUNNEL_HEADERS,
-    DEFAULT_TIMEOUT,
     HEALTH_CHECK_TIMEOUT,
     GENERATION_TIMEOUT,
+    CONNECT_TIMEOUT,
     DEFAULT_MAX_TOKENS,
     DEFAULT_TEMPERATURE
 )
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+# Connection pool settings for the shared keep-alive session
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+# How long health_check()/get_model_info() results are reused (seconds)
+PROBE_CACHE_TTL = 5
+
+# Largest /generate response body read into memory (bytes); a generation of
+# DEFAULT_MAX_TOKENS is a few KB, so anything bigger means a misbehaving server
+MAX_RESPONSE_BYTES = 1024 * 1024
+
+# Retry policy for connect errors and transient tunnel failures. Connect errors
+# are retried for every method (the request never reached the server); read
+# and 502/503/504 retries are limited to GET/HEAD, so a /generate POST that
+# timed out or got a gateway error is never re-sent to a GPU still working on it.
+RETRY_POLICY = Retry(
+    total=3,
+    connect=3,
+    read=2,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    raise_on_status=False
+)
+
+# Probe results shared by every client in the process: endpoint -> (monotonic
+# timestamp, last good response). The per-endpoint locks make concurrent
+# callers wait for one in-flight probe instead of each sending their own.
+_probe_cache: Dict[str, tuple] = {}
+_probe_locks: Dict[str, threading.Lock] = {}
+_probe_locks_guard = threading.Lock()
+
+
+def _probe_lock(endpoint: str) -> threading.Lock:
+    """Lock serializing probes of one endpoint"""
+    with _probe_locks_guard:
+        return _probe_locks.setdefault(endpoint, threading.Lock())
+
+
+def create_pooled_session() -> requests.Session:
+    """
+     Create a keep-alive session with a sized connection pool and retries
+     
+     Returns:
+         requests.Session with the localtunnel headers preset
+     """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=RETRY_POLICY
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Set default headers for all requests
+    session.headers.update(LOCALTUNNEL_HEADERS)
+    return session
+
+
+@lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """
+     Process-wide pooled session used by clients not given their own
+     
+     Every client then reuses the same warm tunnel connections instead of
+     paying a TCP+TLS handshake per client.
+     
+     Returns:
+         The shared requests.Session
+     """
+    return create_pooled_session()
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ColabMistralClient:
-    def __init__(self, colab_url: str = None):
+    def __init__(self, colab_url: str = None, session: Optional[requests.Session] = None):
         """
          Initialize the client
          
          Args:
              colab_url: Optional URL override (uses connection_credentials.py by default)
+             session: Optional session (the process-wide shared_session() if None)
          """
         self.base_url = COLAB_MISTRAL_URL if colab_url is None else colab_url
-        self.session = requests.Session()
-        # Set default headers for all requests
-        self.session.headers.update(LOCALTUNNEL_HEADERS)
+        self.session = shared_session() if session is None else session
+    
+    def close(self) -> None:
+        """Release the session's idle pooled connections (it stays usable)"""
+        self.session.close()
+        
+    def _cached_probe(self, endpoint: str, error_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+         GET a status endpoint, reusing the result for PROBE_CACHE_TTL seconds
+         
+         Results are shared between clients, so a health check done through one
+         client is not repeated by the next. On failure the last good result is
+         returned with stale=True so callers can downgrade this provider without
+         re-probing on every call.
+         
+         Args:
+             endpoint: Status endpoint URL
+             error_result: Result to return when no good result is cached yet
+             
+         Returns:
+             Endpoint JSON response
+         """
+        with _probe_lock(endpoint):
+            cached = _probe_cache.get(endpoint)
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < PROBE_CACHE_TTL:
+                return cached[1]
+            
+            try:
+                response = self.session.get(endpoint, timeout=(CONNECT_TIMEOUT, HEALTH_CHECK_TIMEOUT))
+                result = json_loads(response.content)
+            except Exception as e:
+                if cached is not None:
+                    return {**cached[1], "stale": True}
+                return {**error_result, "error": str(e)}
+            
+            _probe_cache[endpoint] = (time.monotonic(), result)
+            return result
         
     def health_check(self) -> Dict[str, Any]:
-        """Check if the API server is healthy"""
-        try:
-            response = self.session.get(HEALTH_ENDPOINT, timeout=HEALTH_CHECK_TIMEOUT)
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "status": "unhealthy"}
+        """Check if the API server is healthy (cached for PROBE_CACHE_TTL seconds)"""
+        return self._cached_probe(HEALTH_ENDPOINT, {"status": "unhealthy"})
     
     def generate_text(self, prompt: str, max_tokens: int = None, temperature: float = None) -> Dict[str, Any]:
         """
@@ -66,27 +194,29 @@ class ColabMistralClient:
                 "temperature": temperature
             }
             
-            response = self.session.post(
+            # Streamed so the body is read (and decompressed) only up to the cap
+            with self.session.post(
                 GENERATE_ENDPOINT,
-                json=payload,
-                timeout=GENERATION_TIMEOUT
-            )
+                data=json_dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=(CONNECT_TIMEOUT, GENERATION_TIMEOUT),
+                stream=True
+            ) as response:
+                body = response.raw.read(MAX_RESPONSE_BYTES + 1, decode_content=True)
             
+            if len(body) > MAX_RESPONSE_BYTES:
+                return {"error": f"Response exceeds {MAX_RESPONSE_BYTES} bytes"}
             if response.status_code == 200:
-                return response.json()
+                return json_loads(body)
             else:
-                return {"error": f"HTTP {response.status_code}: {response.text}"}
+                return {"error": f"HTTP {response.status_code}: {body.decode('utf-8', 'replace')}"}
                 
         except Exception as e:
             return {"error": str(e)}
     
     def get_model_info(self) -> Dict[str, Any]:
-        """Get information about the loaded model"""
-        try:
-            response = self.session.get(MODEL_INFO_ENDPOINT, timeout=HEALTH_CHECK_TIMEOUT)
-            return response.json()
-        except Exception as e:
-            return {"error": str(e)}
+        """Get information about the loaded model (cached for PROBE_CACHE_TTL seconds)"""
+        return self._cached_probe(MODEL_INFO_ENDPOINT, {})
 
 # Example usage
 if __name__ == "__main__":
@@ -8,5 +8,7 @@ Multi-agent research system agents for enterprise LLM market analysis.
 from .archivist import create_archivist_agent
 from .shadow import create_shadow_agent
 from .nexus import create_nexus_agent
+from .concurrency import max_parallel_agents
+from .registry import get_agent
 
-__all__ = ['create_archivist_agent', 'create_shadow_agent', 'create_nexus_agent'] 
\ No newline at end of file
+__all__ = ['create_archivist_agent', 'create_shadow_agent', 'create_nexus_agent', 'get_agent', 'max_parallel_agents'] 
\ No newline at end of file
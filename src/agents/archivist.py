@@ -6,7 +6,8 @@ Expert in finding relevant market data for the multi-agent research system.
 """
 
 from crewai import Agent
-from ..llm import create_strict_llm
+from ..llm import create_strict_llm, normalize_system_prompt
+from .concurrency import throttled
 
 
 def create_archivist_agent(llm=None) -> Agent:
@@ -25,7 +26,8 @@ def create_archivist_agent(llm=None) -> Agent:
     return Agent(
         role="Expert in finding relevant market data",
         goal="Efficiently collect comprehensive, relevant and up-to-date information, industry reports and news, from reliable sources",
-        backstory="""You are 'Archivist', a world-renowned, AI & Tech Intelligence Specialist from a top-tier global market research and technology analysis firm. Your unparalleled skill lies in meticulously extracting and verifying raw market data, cutting-edge research papers, industry reports, and real-time news from sources you consider trustworthy, reliable, and important within the rapidly evolving AI and LLM landscape. You pride yourself on your speed, accuracy, and ability to unearth the most relevant, granular information that others overlook. You are currently serving 'MostlyOpenAI,' a leading developer of enterprise-grade, highly customizable LLMs, providing them with the foundational intelligence they need.""",
-        llm=llm,
+        backstory=normalize_system_prompt("""You are 'Archivist', a world-renowned, AI & Tech Intelligence Specialist from a top-tier global market research and technology analysis firm. Your unparalleled skill lies in meticulously extracting and verifying raw market data, cutting-edge research papers, industry reports, and real-time news from sources you consider trustworthy, reliable, and important within the rapidly evolving AI and LLM landscape. You pride yourself on your speed, accuracy, and ability to unearth the most relevant, granular information that others overlook. You are currently serving 'MostlyOpenAI,' a leading developer of enterprise-grade, highly customizable LLMs, providing them with the foundational intelligence they need."""),
+        # Each LLM call holds a provider slot (LLM_MAX_CONCURRENT)
+        llm=throttled(llm),
         verbose=True
     ) 
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+Agent Concurrency Module
+=======================
+
+Caps how many agents call the same LLM provider at once, so async tasks
+fanning out together stay within the provider's rate limits instead of
+failing with 429s and retrying away the parallelism. Agents get a
+ThrottledLLM, which holds a provider slot for each LLM call (not for the
+whole task); 429s are retried by crewai's jittered backoff around each
+call, with the slot released while waiting.
+"""
+
+import os
+import time
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+from crewai.llms.base_llm import BaseLLM
+
+from ..llm import ModelConfig
+from ..llm.llm_wrapper import LLMWrapper
+
+T = TypeVar('T')
+
+_provider_slots: Dict[str, threading.BoundedSemaphore] = {}
+_provider_slots_lock = threading.Lock()
+
+
+def max_parallel_agents() -> int:
+    """Maximum concurrent agent calls per provider (LLM_MAX_CONCURRENT, default 3)."""
+    return max(1, int(os.getenv('LLM_MAX_CONCURRENT', '3')))
+
+
+def _provider(llm: Any) -> str:
+    """Provider an LLM talks to ('openai', 'gemini', ...)."""
+    provider = getattr(llm, 'provider', None)
+    if provider:
+        return str(provider)
+    model = str(getattr(llm, 'model', '') or '')
+    return model.split('/', 1)[0] if '/' in model else model
+
+
+def _slots(llm: Any) -> threading.BoundedSemaphore:
+    """Concurrency slots shared by every LLM of the same provider."""
+    provider = _provider(llm)
+    with _provider_slots_lock:
+        slots = _provider_slots.get(provider)
+        if slots is None:
+            slots = _provider_slots[provider] = threading.BoundedSemaphore(max_parallel_agents())
+        return slots
+
+
+@contextmanager
+def llm_slot(llm: Any) -> Iterator[None]:
+    """
+    Hold one of the provider's concurrency slots for the duration of a call
+
+    Args:
+        llm: LLM instance the call goes to (slots are shared per provider)
+    """
+    with _slots(llm):
+        yield
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Check whether an exception is a provider rate-limit (429) error."""
+    if getattr(error, 'status_code', None) == 429:
+        return True
+    return 'RateLimit' in type(error).__name__
+
+
+def is_key_failure(error: BaseException) -> bool:
+    """Check whether an exception points at the API key (rate limit or rejected key)."""
+    if is_rate_limited(error):
+        return True
+    if getattr(error, 'status_code', None) in (401, 403):
+        return True
+    return 'Authentication' in type(error).__name__ or 'PermissionDenied' in type(error).__name__
+
+
+def _report(llm: Any, started: float, error: Optional[BaseException] = None) -> None:
+    """Record a call's outcome against its API key (see ModelConfig.report_llm_result)."""
+    if error is None:
+        ModelConfig.report_llm_result(llm, latency=time.monotonic() - started)
+    elif is_key_failure(error):
+        ModelConfig.report_llm_result(llm, failed=True)
+
+
+async def _acquire(slots: threading.BoundedSemaphore) -> None:
+    """Wait for a slot off the event loop, without leaking it if the wait is cancelled."""
+    # The semaphore is a threading one (shared with sync callers), so the
+    # blocking acquire runs on a worker thread that cannot be interrupted
+    waiter = asyncio.ensure_future(asyncio.to_thread(slots.acquire))
+    try:
+        await asyncio.shield(waiter)
+    except asyncio.CancelledError:
+        waiter.add_done_callback(
+            lambda done: slots.release() if not done.cancelled() and done.exception() is None else None
+        )
+        raise
+
+
+def call_with_llm_slot(llm: Any, fn: Callable[[], T]) -> T:
+    """
+    Run one LLM call inside a provider slot and report its outcome
+
+    The outcome (latency or key failure) is reported to the LLM's API key
+    router.
+
+    Args:
+        llm: LLM instance the call goes to
+        fn: Zero-argument callable performing the call
+
+    Returns:
+        fn's result
+    """
+    with llm_slot(llm):
+        started = time.monotonic()
+        try:
+            result = fn()
+        except Exception as e:
+            _report(llm, started, e)
+            raise
+    _report(llm, started)
+    return result
+
+
+async def acall_with_llm_slot(llm: Any, fn: Callable[[], Awaitable[T]]) -> T:
+    """
+    Async variant of call_with_llm_slot (slots are shared with sync callers)
+
+    Args:
+        llm: LLM instance the call goes to
+        fn: Zero-argument coroutine function performing the call
+
+    Returns:
+        fn's result
+    """
+    slots = _slots(llm)
+    await _acquire(slots)
+    started = time.monotonic()
+    try:
+        result = await fn()
+    except Exception as e:
+        _report(llm, started, e)
+        raise
+    finally:
+        slots.release()
+    _report(llm, started)
+    return result
+
+
+class ThrottledLLM(LLMWrapper):
+    """LLM whose calls each hold one of the provider's concurrency slots"""
+
+    def call(self, messages: Any, **kwargs) -> Any:
+        """Call the wrapped LLM inside a provider slot."""
+        return call_with_llm_slot(self.base_llm, lambda: self._forward(messages, **kwargs))
+
+    async def acall(self, messages: Any, **kwargs) -> Any:
+        """Call the wrapped LLM asynchronously inside a provider slot."""
+        return await acall_with_llm_slot(self.base_llm, lambda: self._aforward(messages, **kwargs))
+
+
+def throttled(llm: Any) -> Any:
+    """
+    Wrap an agent's LLM so its calls respect LLM_MAX_CONCURRENT
+
+    Args:
+        llm: LLM instance (anything that is not a crewai BaseLLM is returned as is)
+
+    Returns:
+        ThrottledLLM around llm
+    """
+    if isinstance(llm, ThrottledLLM) or not isinstance(llm, BaseLLM):
+        return llm
+    return ThrottledLLM(llm)
@@ -6,7 +6,8 @@ Expert in concise and actionable reporting for the multi-agent research system.
 """
 
 from crewai import Agent
-from ..llm import create_standard_llm
+from ..llm import create_standard_llm, normalize_system_prompt
+from .concurrency import throttled
 
 
 def create_nexus_agent(llm=None) -> Agent:
@@ -19,13 +20,18 @@ def create_nexus_agent(llm=None) -> Agent:
     Returns:
         Configured Nexus agent
     """
+    # Imported here so matplotlib is only loaded when Nexus is actually built
+    from ..tools import GeneratePlotTool, GeneratePlotBatchTool
+
     if llm is None:
         llm = create_standard_llm()  # Standard for synthesis tasks
     
     return Agent(
         role="Expert in concise and actionable reporting",
         goal="Synthesize all research findings, competitive intelligence, and trend analysis into comprehensive executive reports with actionable strategic recommendations",
-        backstory="""You are 'Nexus', a senior strategy consultant and executive communications expert with an MBA from Wharton and 20+ years of experience creating high-impact executive briefings for Fortune 500 CEOs. You've served as Chief Strategy Officer for multiple technology companies and have a proven track record of distilling complex market research into clear, actionable strategic recommendations. Your specialty is transforming vast amounts of data and analysis into compelling narratives that drive executive decision-making. You excel at creating visually compelling reports that combine rigorous analysis with clear strategic direction. Your current mission is to help 'MostlyOpenAI' leadership understand market dynamics and make informed strategic decisions based on comprehensive intelligence gathering.""",
-        llm=llm,
+        backstory=normalize_system_prompt("""You are 'Nexus', a senior strategy consultant and executive communications expert with an MBA from Wharton and 20+ years of experience creating high-impact executive briefings for Fortune 500 CEOs. You've served as Chief Strategy Officer for multiple technology companies and have a proven track record of distilling complex market research into clear, actionable strategic recommendations. Your specialty is transforming vast amounts of data and analysis into compelling narratives that drive executive decision-making. You excel at creating visually compelling reports that combine rigorous analysis with clear strategic direction. Your current mission is to help 'MostlyOpenAI' leadership understand market dynamics and make informed strategic decisions based on comprehensive intelligence gathering."""),
+        tools=[GeneratePlotTool(), GeneratePlotBatchTool()],
+        # Each LLM call holds a provider slot (LLM_MAX_CONCURRENT)
+        llm=throttled(llm),
         verbose=True
     ) 
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Agent Registry Module
+====================
+
+Builds each default agent once, on first use, and shares it between the
+crew and every task that names it (concurrent tasks ask for a fresh one).
+"""
+
+import threading
+from typing import Callable, Dict
+
+from crewai import Agent
+
+from .archivist import create_archivist_agent
+from .shadow import create_shadow_agent
+from .nexus import create_nexus_agent
+
+
+_AGENT_FACTORIES: Dict[str, Callable[[], Agent]] = {
+    'archivist': create_archivist_agent,
+    'shadow': create_shadow_agent,
+    'nexus': create_nexus_agent
+}
+
+_agents: Dict[str, Agent] = {}
+# One lock per agent so different agents can still be built concurrently
+_agent_locks = {name: threading.Lock() for name in _AGENT_FACTORIES}
+
+
+def get_agent(name: str, fresh: bool = False) -> Agent:
+    """
+    Get the shared default agent with the given name
+    
+    Args:
+        name: 'archivist', 'shadow' or 'nexus'
+        fresh: Build a new, unshared instance instead. crewai keeps per-task
+            executor state on the Agent, so tasks that run concurrently
+            (async_execution=True) must not share one
+        
+    Returns:
+        Agent instance (created on the first call for each name)
+        
+    Raises:
+        ValueError: If the name is unknown
+    """
+    lock = _agent_locks.get(name)
+    if lock is None:
+        raise ValueError(f"Unknown agent: {name}")
+    if fresh:
+        return _AGENT_FACTORIES[name]()
+    
+    agent = _agents.get(name)
+    if agent is not None:
+        return agent
+    with lock:
+        agent = _agents.get(name)
+        if agent is None:
+            agent = _agents[name] = _AGENT_FACTORIES[name]()
+    return agent
@@ -6,7 +6,8 @@ Expert in dissecting competitor strategies for the multi-agent research system.
 """
 
 from crewai import Agent
-from ..llm import create_standard_llm
+from ..llm import create_standard_llm, normalize_system_prompt
+from .concurrency import throttled
 
 
 def create_shadow_agent(llm=None) -> Agent:
@@ -25,7 +26,8 @@ def create_shadow_agent(llm=None) -> Agent:
     return Agent(
         role="Expert in dissecting competitor strategies and positioning",
         goal="Conduct thorough competitive intelligence analysis, understanding the strategic positioning and tactical approaches of competitors in the enterprise LLM space",
-        backstory="""You are 'Shadow', a former military intelligence analyst turned corporate strategist, now working as a senior competitive intelligence expert for major technology consulting firms. Your analytical prowess stems from years of experience in extracting meaningful insights from limited public information, understanding strategic positioning, and predicting competitor moves. You excel at reading between the lines of marketing materials, press releases, and public statements to uncover the real strategic intent and positioning. Your current mission is to provide 'MostlyOpenAI' with deep competitive intelligence that will inform their market positioning and strategic decisions.""",
-        llm=llm,
+        backstory=normalize_system_prompt("""You are 'Shadow', a former military intelligence analyst turned corporate strategist, now working as a senior competitive intelligence expert for major technology consulting firms. Your analytical prowess stems from years of experience in extracting meaningful insights from limited public information, understanding strategic positioning, and predicting competitor moves. You excel at reading between the lines of marketing materials, press releases, and public statements to uncover the real strategic intent and positioning. Your current mission is to provide 'MostlyOpenAI' with deep competitive intelligence that will inform their market positioning and strategic decisions."""),
+        # Each LLM call holds a provider slot (LLM_MAX_CONCURRENT)
+        llm=throttled(llm),
         verbose=True
     ) 
\ No newline at end of file
@@ -11,7 +11,8 @@ from .model_config import (
     ModelConfig,
     create_llm,
     create_strict_llm,
-    create_standard_llm
+    create_standard_llm,
+    normalize_system_prompt
 )
 
 # Backward compatibility imports
@@ -27,6 +28,7 @@ __all__ = [
     'create_llm',
     'create_strict_llm',
     'create_standard_llm',
+    'normalize_system_prompt',
     
     # Backward compatibility
     'create_gemini_llm',
@@ -0,0 +1,67 @@
+"""
+Batch LLM Module
+================
+
+Concurrent fan-out wrapper for LLMs created by ModelConfig. Independent
+prompts are issued in parallel so N provider round-trips overlap instead
+of running back to back.
+"""
+
+import asyncio
+from typing import Any, List
+
+from .llm_wrapper import LLMWrapper
+
+
+# Default number of concurrent provider calls
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class BatchLLM(LLMWrapper):
+    """
+    Batching decorator around an LLM instance.
+
+    Adds call_batch()/acall_batch() for independent prompts. call()/acall()
+    go straight to the wrapped LLM, so the wrapper can also be handed to an
+    Agent like the original LLM.
+    """
+
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+
+    async def _acall(self, semaphore: asyncio.Semaphore, prompt: Any, **kwargs) -> Any:
+        """Run one blocking call() on a worker thread under the concurrency limit."""
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: self._forward(prompt, **kwargs))
+
+    async def acall_batch(self, prompts: List[Any], **kwargs) -> List[Any]:
+        """
+        Call the wrapped LLM for several independent prompts concurrently.
+
+        Args:
+            prompts: Prompt strings or chat message lists
+            **kwargs: Forwarded to every call()
+
+        Returns:
+            Responses in the same order as prompts
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(
+            *[self._acall(semaphore, prompt, **kwargs) for prompt in prompts]
+        )
+
+    def call_batch(self, prompts: List[Any], **kwargs) -> List[Any]:
+        """
+        Synchronous wrapper around acall_batch().
+
+        Must not be called from inside a running event loop; use
+        acall_batch() there.
+
+        Args:
+            prompts: Prompt strings or chat message lists
+            **kwargs: Forwarded to every call()
+
+        Returns:
+            Responses in the same order as prompts
+        """
+        return asyncio.run(self.acall_batch(prompts, **kwargs))
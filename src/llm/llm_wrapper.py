@@ -0,0 +1,80 @@
+"""
+LLM Wrapper Module
+==================
+
+Base class for the LLM decorators in this package (SemanticCachingLLM,
+SingleFlightLLM, BatchLLM). A wrapper is itself a CrewAI BaseLLM, so it is
+accepted by Agent(llm=...) exactly like the provider LLM it wraps.
+"""
+
+from typing import Any
+
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+
+
+class LLMWrapper(BaseLLM):
+    """
+    BaseLLM that forwards every call to a wrapped provider LLM.
+
+    Model settings (model, provider, api_key, ...) are mirrored from the
+    wrapped LLM so agents, usage metrics and ModelConfig.report_llm_result
+    see the same model and key. Subclasses override call()/acall() and reach
+    the provider through _forward()/_aforward().
+    """
+
+    llm_type: str = "wrapper"
+    base_llm: BaseLLM
+
+    def __init__(self, base_llm: BaseLLM, **data: Any):
+        """
+        Initialize the wrapper.
+
+        Args:
+            base_llm: Provider LLM to wrap
+            **data: Subclass settings
+        """
+        super().__init__(
+            base_llm=base_llm,
+            model=base_llm.model,
+            provider=base_llm.provider,
+            temperature=base_llm.temperature,
+            max_tokens=base_llm.max_tokens,
+            api_key=base_llm.api_key,
+            base_url=base_llm.base_url,
+            stop=list(base_llm.stop),
+            **data
+        )
+
+    def _forward(self, messages: Any, **kwargs) -> Any:
+        """Call the wrapped LLM, carrying over this call's stop words."""
+        # Agents scope their stop words to the LLM they were given (this wrapper)
+        with call_stop_override(self.base_llm, self.stop_sequences):
+            return self.base_llm.call(messages, **kwargs)
+
+    async def _aforward(self, messages: Any, **kwargs) -> Any:
+        """Async counterpart of _forward()."""
+        with call_stop_override(self.base_llm, self.stop_sequences):
+            return await self.base_llm.acall(messages, **kwargs)
+
+    def call(self, messages: Any, **kwargs) -> Any:
+        """Call the wrapped LLM."""
+        return self._forward(messages, **kwargs)
+
+    async def acall(self, messages: Any, **kwargs) -> Any:
+        """Call the wrapped LLM asynchronously."""
+        return await self._aforward(messages, **kwargs)
+
+    def supports_function_calling(self) -> bool:
+        return self.base_llm.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.base_llm.supports_stop_words()
+
+    def supports_multimodal(self) -> bool:
+        return self.base_llm.supports_multimodal()
+
+    def get_context_window_size(self) -> int:
+        return self.base_llm.get_context_window_size()
+
+    def get_token_usage_summary(self) -> Any:
+        return self.base_llm.get_token_usage_summary()
@@ -8,8 +8,227 @@ model switching.
 """
 
 import os
-from typing import Dict, Any, Optional
-from crewai import LLM
+import re
+import time
+import atexit
+import weakref
+import itertools
+import threading
+import warnings
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterable, Mapping, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import requests
+    from crewai import LLM
+
+
+# Timeout/retry tuning (override per deployment to match the provider's latency tail)
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_TIMEOUT_RETRIES = 2
+
+# How long a failing API key is skipped before it is probed again
+DEFAULT_KEY_COOLDOWN_SECS = 60.0
+
+# Provider API hosts used to pre-warm DNS/TCP/TLS before the first real call
+PROVIDER_HOSTS = {
+    'gemini': 'https://generativelanguage.googleapis.com',
+    'openai': 'https://api.openai.com',
+    'anthropic': 'https://api.anthropic.com',
+    'mistral': 'https://api.mistral.ai'
+}
+PREWARM_TIMEOUT = 2
+
+# Connection limits for the provider client shared by all agents
+SHARED_HTTP_MAX_KEEPALIVE = 16
+SHARED_HTTP_MAX_CONNECTIONS = 32
+SHARED_HTTP_KEEPALIVE_EXPIRY = 30
+
+# Most providers only cache prompt prefixes at or above this size
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# Volatile fragments that would break byte-identical system prompts
+_VOLATILE_PROMPT_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+    r"|\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
+    re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Providers whose native SDK client takes an httpx.Timeout, so the connect
+# timeout can be set separately from the read timeout
+_HTTPX_TIMEOUT_PROVIDERS = ('openai', 'anthropic')
+
+# Sampling params not every provider accepts; dropped instead of erroring
+_ADDITIONAL_DROP_PARAMS = ("stop", "frequency_penalty", "presence_penalty")
+
+
+def _llm_timeout(default_read: float) -> Tuple[float, float]:
+    """
+    Resolve (connect, read) timeouts in seconds from the environment.
+    
+    Args:
+        default_read: Per-model read timeout from MODEL_CONFIGS
+        
+    Returns:
+        Tuple of (connect, read) timeouts
+    """
+    connect = float(os.getenv('LLM_TIMEOUT_CONNECT', DEFAULT_CONNECT_TIMEOUT))
+    read = float(os.getenv('LLM_TIMEOUT_READ', default_read))
+    return connect, read
+
+
+def _llm_timeout_retries() -> int:
+    """Number of times a timed-out provider call is re-issued."""
+    return int(os.getenv('LLM_TIMEOUT_RETRIES', DEFAULT_TIMEOUT_RETRIES))
+
+
+def normalize_system_prompt(prompt: str, warn: bool = False) -> str:
+    """
+    Make a system prompt byte-identical across calls so prefix caching hits.
+    
+    Strips timestamps and UUIDs and collapses whitespace. Per-run state
+    (memory, retrieved context) belongs in a separate user message, never in
+    the cached system prefix.
+    
+    Args:
+        prompt: System prompt text
+        warn: Warn when the prompt is below the provider caching minimum
+        
+    Returns:
+        Normalized system prompt
+    """
+    normalized = _WHITESPACE_RE.sub(' ', _VOLATILE_PROMPT_RE.sub('', prompt)).strip()
+    
+    # Rough approximation: 1 token ≈ 4 characters
+    if warn and len(normalized) // 4 < PROMPT_CACHE_MIN_TOKENS:
+        warnings.warn(
+            f"System prompt is ~{len(normalized) // 4} tokens; most providers only cache "
+            f"prefixes of {PROMPT_CACHE_MIN_TOKENS}+ tokens",
+            stacklevel=2
+        )
+    
+    return normalized
+
+
+@lru_cache(maxsize=1)
+def _prewarm_session() -> "requests.Session":
+    """Keep-alive session used for connection pre-warming (created on first use)."""
+    # Imported lazily so importing this module stays cheap
+    import requests
+    return requests.Session()
+
+
+@dataclass(frozen=True)
+class ModelRecord:
+    """Flattened, immutable configuration for one (provider, model) pair."""
+    
+    __slots__ = ('model_name', 'temperature', 'max_tokens', 'timeout',
+                 'cost_efficiency', 'api_key_env', 'provider_name')
+    
+    model_name: str
+    temperature: float
+    max_tokens: int
+    timeout: int
+    cost_efficiency: str
+    api_key_env: str
+    provider_name: str
+
+
+@dataclass(frozen=True)
+class ProviderRecord:
+    """Immutable configuration for one provider and its models."""
+    
+    __slots__ = ('models', 'api_key_env', 'provider_name', 'fallback_providers')
+    
+    models: Mapping[str, ModelRecord]
+    api_key_env: str
+    provider_name: str
+    fallback_providers: Tuple[str, ...]
+
+
+class _KeyRouter:
+    """
+    Round-robin API key selection with failure cooldown.
+    
+    Keys rotate on every pick so per-key rate limits add up. A key reported
+    as failing is skipped until its cooldown expires, after which it is
+    rotated back in to probe for recovery. Per-key EWMA latency is tracked
+    for diagnostics.
+    """
+    
+    def __init__(self, keys: Iterable[str],
+                 cooldown_secs: float = DEFAULT_KEY_COOLDOWN_SECS,
+                 alpha: float = 0.3):
+        """
+        Initialize the router.
+        
+        Args:
+            keys: API keys for a single provider
+            cooldown_secs: Seconds a failed key is skipped
+            alpha: EWMA smoothing factor for latency
+        """
+        self.keys = tuple(keys)
+        self.cooldown_secs = cooldown_secs
+        self.alpha = alpha
+        self._cycle = itertools.cycle(self.keys)
+        self._cooldown_until = {key: 0.0 for key in self.keys}
+        self._failures = {key: 0 for key in self.keys}
+        self._latency: Dict[str, Optional[float]] = {key: None for key in self.keys}
+        self._lock = threading.Lock()
+    
+    def is_healthy(self) -> bool:
+        """Check whether at least one key is outside its cooldown."""
+        now = time.monotonic()
+        return any(until <= now for until in self._cooldown_until.values())
+    
+    def pick(self) -> str:
+        """
+        Get the next healthy key in rotation.
+        
+        Returns:
+            API key (the key closest to recovery if all are cooling down)
+        """
+        with self._lock:
+            now = time.monotonic()
+            for _ in range(len(self.keys)):
+                key = next(self._cycle)
+                if self._cooldown_until[key] <= now:
+                    return key
+            return min(self.keys, key=self._cooldown_until.__getitem__)
+    
+    def on_failure(self, key: str) -> None:
+        """Mark a key unhealthy for the cooldown period."""
+        with self._lock:
+            if key in self._failures:
+                self._failures[key] += 1
+                self._cooldown_until[key] = time.monotonic() + self.cooldown_secs
+    
+    def on_success(self, key: str, latency: float) -> None:
+        """Record a successful call and fold its latency into the EWMA."""
+        with self._lock:
+            if key in self._failures:
+                previous = self._latency[key]
+                self._latency[key] = latency if previous is None else (
+                    self.alpha * latency + (1 - self.alpha) * previous
+                )
+                self._failures[key] = 0
+                self._cooldown_until[key] = 0.0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get per-key health statistics (keys are masked)."""
+        now = time.monotonic()
+        return {
+            f"...{key[-4:]}": {
+                'failures': self._failures[key],
+                'cooling_down': self._cooldown_until[key] > now,
+                'ewma_latency': self._latency[key]
+            }
+            for key in self.keys
+        }
 
 
 class ModelConfig:
@@ -21,6 +240,7 @@ class ModelConfig:
     """
     
     # Model configurations for different providers
+    # (api_key_env may hold several comma-separated keys for load balancing)
     MODEL_CONFIGS = {
         # Google Gemini Models
         'gemini': {
@@ -29,25 +249,26 @@ class ModelConfig:
                     'model_name': 'gemini/gemini-2.0-flash-lite',
                     'temperature': 0.3,
                     'max_tokens': 300,
-                    'timeout': 60,
+                    'timeout': 15,
                     'cost_efficiency': 'high'
                 },
                 'gemini-2.0-flash': {
                     'model_name': 'gemini/gemini-2.0-flash',
                     'temperature': 0.3,
                     'max_tokens': 500,
-                    'timeout': 60,
+                    'timeout': 15,
                     'cost_efficiency': 'medium'
                 },
                 'gemini-1.5-flash': {
                     'model_name': 'gemini/gemini-1.5-flash',
                     'temperature': 0.3,
                     'max_tokens': 400,
-                    'timeout': 60,
+                    'timeout': 15,
                     'cost_efficiency': 'medium'
                 }
             },
             'api_key_env': 'GEN_MODEL_API',
+            'fallback_providers': ['openai', 'anthropic', 'mistral'],
             'provider_name': 'Google Gemini'
         },
         
@@ -70,6 +291,7 @@ class ModelConfig:
                 }
             },
             'api_key_env': 'OPENAI_API_KEY',
+            'fallback_providers': ['anthropic', 'gemini', 'mistral'],
             'provider_name': 'OpenAI'
         },
         
@@ -92,6 +314,7 @@ class ModelConfig:
                 }
             },
             'api_key_env': 'ANTHROPIC_API_KEY',
+            'fallback_providers': ['openai', 'gemini', 'mistral'],
             'provider_name': 'Anthropic'
         },
         
@@ -114,27 +337,215 @@ class ModelConfig:
                 }
             },
             'api_key_env': 'MISTRAL_API_KEY',
+            'fallback_providers': ['openai', 'anthropic', 'gemini'],
             'provider_name': 'Mistral AI'
         }
     }
     
     @classmethod
-    def get_available_providers(cls) -> Dict[str, Dict[str, Any]]:
+    @lru_cache(maxsize=1)
+    def _providers_snapshot(cls) -> Tuple[Tuple[str, Mapping[str, Any]], ...]:
         """
-        Get all available providers based on environment variables.
+        Read provider API keys from the environment once.
+        
+        Each entry is a read-only copy of the provider configuration with its
+        'api_keys' (comma-separated in the environment) and the first key as
+        'api_key' attached; MODEL_CONFIGS itself is never mutated. Call
+        invalidate_providers() after changing the environment.
         
         Returns:
-            Dictionary of available providers with their configurations
+            Tuple of (provider, read-only configuration) pairs
         """
-        available = {}
+        snapshot = []
         
         for provider, config in cls.MODEL_CONFIGS.items():
-            api_key = os.getenv(config['api_key_env'])
-            if api_key:
-                available[provider] = config
-                available[provider]['api_key'] = api_key
+            raw_keys = os.getenv(config['api_key_env'], '')
+            api_keys = tuple(key.strip() for key in raw_keys.split(',') if key.strip())
+            if api_keys:
+                snapshot.append((provider, MappingProxyType({
+                    **config,
+                    'api_key': api_keys[0],
+                    'api_keys': api_keys
+                })))
+        
+        return tuple(snapshot)
+    
+    # Per-provider key routers, rebuilt whenever the environment is re-read
+    _key_routers: Dict[str, _KeyRouter] = {}
+    _key_routers_lock = threading.Lock()
+    
+    @classmethod
+    def invalidate_providers(cls) -> None:
+        """Forget cached provider availability so the environment is re-read."""
+        cls._providers_snapshot.cache_clear()
+        with cls._key_routers_lock:
+            cls._key_routers.clear()
+        # Memoized LLMs may hold keys that are no longer configured
+        _build_llm.cache_clear()
+    
+    _prewarmed = False
+    
+    @classmethod
+    def prewarm(cls) -> None:
+        """
+        Open connections to every available provider in the background.
+        
+        Fires a cheap HEAD request per provider host on daemon threads so the
+        DNS lookup and TCP+TLS handshake are off the critical path of the
+        first real LLM call. Errors are ignored. Opt-in: set LLM_PREWARM=1 to
+        run it automatically on the first create_llm call.
+        """
+        cls._prewarmed = True
+        session = _prewarm_session()
+        
+        def _head(url: str) -> None:
+            try:
+                session.head(url, timeout=PREWARM_TIMEOUT)
+            except Exception:
+                pass
+        
+        for provider in cls.get_available_providers():
+            host = PROVIDER_HOSTS.get(provider)
+            if host:
+                threading.Thread(target=_head, args=(host,), daemon=True).start()
+    
+    # Shared HTTP clients handed to LiteLLM (see enable_shared_http_client)
+    _http_clients: Tuple[Any, ...] = ()
+    _http_versions: Counter = Counter()
+    
+    @classmethod
+    def enable_shared_http_client(cls, http2: bool = False) -> bool:
+        """
+        Route every agent's LiteLLM provider calls through one pooled client.
+        
+        Only affects models crewai routes through LiteLLM: its native
+        providers (OpenAI, Anthropic, Gemini, ...) never read LiteLLM's client
+        sessions and use their SDK client's own pool, which agents sharing a
+        memoized LLM already share. For LiteLLM-routed models, Archivist,
+        Shadow and Nexus then reuse warm keep-alive (or, with http2=True,
+        multiplexed HTTP/2) connections, counted per HTTP version (see
+        get_http_stats). HTTP2_ENABLED=1 selects HTTP/2 (requires httpx[http2]).
+        
+        Args:
+            http2: Negotiate HTTP/2 instead of HTTP/1.1 keep-alive
+        
+        Returns:
+            True if the shared clients are installed
+        """
+        if cls._http_clients:
+            return True
+        
+        try:
+            import httpx
+            import litellm
+        except ImportError:
+            return False
+        
+        def _count(response) -> None:
+            cls._http_versions[response.extensions.get('http_version', b'?').decode()] += 1
+        
+        async def _acount(response) -> None:
+            _count(response)
+        
+        limits = httpx.Limits(
+            max_keepalive_connections=SHARED_HTTP_MAX_KEEPALIVE,
+            max_connections=SHARED_HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=SHARED_HTTP_KEEPALIVE_EXPIRY
+        )
+        try:
+            client = httpx.Client(http2=http2, limits=limits,
+                                  event_hooks={'response': [_count]})
+            aclient = httpx.AsyncClient(http2=http2, limits=limits,
+                                        event_hooks={'response': [_acount]})
+        except ImportError:
+            # http2=True without the h2 package
+            return False
+        
+        litellm.client_session = client
+        litellm.aclient_session = aclient
+        cls._http_clients = (client, aclient)
+        return True
+    
+    @classmethod
+    def enable_http2(cls) -> bool:
+        """
+        Route LiteLLM provider calls through shared HTTP/2 clients.
+        
+        Native crewai providers are unaffected (see enable_shared_http_client).
+        
+        Returns:
+            True if HTTP/2 clients are installed
+        """
+        return cls.enable_shared_http_client(http2=True)
+    
+    @classmethod
+    def get_http_stats(cls) -> Dict[str, int]:
+        """Get provider response counts per HTTP version (shared clients only)."""
+        return dict(cls._http_versions)
+    
+    @classmethod
+    def get_key_router(cls, provider: str) -> _KeyRouter:
+        """
+        Get the API key router for an available provider.
+        
+        Args:
+            provider: Provider name
+            
+        Returns:
+            _KeyRouter rotating over the provider's configured keys
+        """
+        with cls._key_routers_lock:
+            router = cls._key_routers.get(provider)
+            if router is None:
+                api_keys = cls.get_available_providers()[provider]['api_keys']
+                router = cls._key_routers[provider] = _KeyRouter(api_keys)
+            return router
+    
+    @classmethod
+    def report_key_failure(cls, provider: str, api_key: str) -> None:
+        """Mark an API key as failing so create_llm skips it during cooldown."""
+        cls.get_key_router(provider).on_failure(api_key)
+    
+    @classmethod
+    def report_key_success(cls, provider: str, api_key: str, latency: float) -> None:
+        """Record a successful call (seconds) for an API key."""
+        cls.get_key_router(provider).on_success(api_key, latency)
+    
+    @classmethod
+    def report_llm_result(cls, llm: Any, latency: Optional[float] = None, failed: bool = False) -> None:
+        """
+        Feed the outcome of a call made with a create_llm() LLM back into key routing.
+        
+        The LLM's API key is looked up among the configured providers' keys, so
+        a failing key is skipped (and, once all of a provider's keys are cooling
+        down, its fallback provider used) by later create_llm calls.
+        
+        Args:
+            llm: LLM the call was made with
+            latency: Call duration in seconds (successful calls)
+            failed: The call failed in a way attributable to its key (429/401/403)
+        """
+        api_key = getattr(llm, 'api_key', None)
+        if not api_key:
+            return
+        with cls._key_routers_lock:
+            router = next((router for router in cls._key_routers.values() if api_key in router.keys), None)
+        if router is None:
+            return
+        if failed:
+            router.on_failure(api_key)
+        elif latency is not None:
+            router.on_success(api_key, latency)
+    
+    @classmethod
+    def get_available_providers(cls) -> Dict[str, Mapping[str, Any]]:
+        """
+        Get all available providers based on environment variables.
         
-        return available
+        Returns:
+            Dictionary of available providers with their configurations
+        """
+        return dict(cls._providers_snapshot())
     
     @classmethod
     def get_default_provider(cls) -> Optional[str]:
@@ -144,8 +555,8 @@ class ModelConfig:
         Returns:
             Provider name or None if no providers available
         """
-        available = cls.get_available_providers()
-        return list(available.keys())[0] if available else None
+        # First entry of the cached snapshot; no dict/list copy needed
+        return next((provider for provider, _ in cls._providers_snapshot()), None)
     
     @classmethod
     def get_default_model(cls, provider: str) -> Optional[str]:
@@ -158,12 +569,8 @@ class ModelConfig:
         Returns:
             Model name or None if provider not available
         """
-        if provider not in cls.MODEL_CONFIGS:
-            return None
-            
-        models = cls.MODEL_CONFIGS[provider]['models']
-        # Return the first model (usually most cost-efficient)
-        return list(models.keys())[0] if models else None
+        # First model per provider (usually most cost-efficient), frozen at import
+        return _DEFAULT_MODEL.get(provider)
     
     @classmethod
     def create_llm(cls, 
@@ -171,7 +578,11 @@ class ModelConfig:
                   model: Optional[str] = None,
                   temperature: Optional[float] = None,
                   max_tokens: Optional[int] = None,
-                  timeout: Optional[int] = None) -> LLM:
+                  timeout: Optional[int] = None,
+                  semantic_cache: Union[bool, Callable[[str], Any]] = False,
+                  single_flight: bool = False,
+                  cache_system_prompt: bool = True,
+                  cache_ttl_minutes: int = 5) -> "LLM":
         """
         Create an LLM instance with automatic provider/model selection.
         
@@ -180,7 +591,16 @@ class ModelConfig:
             model: Model name (auto-selected if None)
             temperature: Override temperature
             max_tokens: Override max tokens
-            timeout: Override timeout
+            timeout: Override read timeout (LLM_TIMEOUT_READ or the model default if None)
+            semantic_cache: Wrap the LLM in a SemanticCachingLLM so repeated
+                prompts are answered from memory; pass an embedder callable
+                instead of True to also match near-duplicate prompts
+            single_flight: Wrap the LLM in a SingleFlightLLM so concurrent
+                identical prompts share one provider call
+            cache_system_prompt: Mark the system prompt cacheable so the provider
+                reuses the prefilled prefix (explicit opt-in needed for Anthropic;
+                Gemini/OpenAI cache byte-identical prefixes automatically)
+            cache_ttl_minutes: Prompt cache lifetime (Anthropic supports 5 or 60)
             
         Returns:
             Configured LLM instance
@@ -195,13 +615,33 @@ class ModelConfig:
                 raise ValueError("No LLM providers available. Please set one of: GEN_MODEL_API, OPENAI_API_KEY, ANTHROPIC_API_KEY, MISTRAL_API_KEY")
         
         # Validate provider
-        if provider not in cls.MODEL_CONFIGS:
+        provider_record = _CFG.get(provider)
+        if provider_record is None:
             raise ValueError(f"Unknown provider: {provider}")
         
         # Check if provider is available
         available = cls.get_available_providers()
         if provider not in available:
-            raise ValueError(f"Provider '{provider}' not available. Missing API key: {cls.MODEL_CONFIGS[provider]['api_key_env']}")
+            raise ValueError(f"Provider '{provider}' not available. Missing API key: {provider_record.api_key_env}")
+        
+        if not cls._prewarmed and os.getenv('LLM_PREWARM') == '1':
+            cls.prewarm()
+        
+        # Route around a provider whose keys are all cooling down
+        router = cls.get_key_router(provider)
+        if not router.is_healthy():
+            for fallback in provider_record.fallback_providers:
+                if fallback in available and cls.get_key_router(fallback).is_healthy():
+                    return cls.create_llm(
+                        provider=fallback,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        timeout=timeout,
+                        semantic_cache=semantic_cache,
+                        single_flight=single_flight,
+                        cache_system_prompt=cache_system_prompt,
+                        cache_ttl_minutes=cache_ttl_minutes
+                    )
         
         # Auto-select model if not specified
         if model is None:
@@ -210,30 +650,52 @@ class ModelConfig:
                 raise ValueError(f"No models available for provider: {provider}")
         
         # Get model configuration
-        provider_config = cls.MODEL_CONFIGS[provider]
-        if model not in provider_config['models']:
+        record = provider_record.models.get(model)
+        if record is None:
             raise ValueError(f"Unknown model '{model}' for provider '{provider}'")
         
-        model_config = provider_config['models'][model]
-        
         # Use provided values or defaults
-        final_temperature = temperature if temperature is not None else model_config['temperature']
-        final_max_tokens = max_tokens if max_tokens is not None else model_config['max_tokens']
-        final_timeout = timeout if timeout is not None else model_config['timeout']
-        
-        # Create LLM instance
-        return LLM(
-            model=model_config['model_name'],
-            api_key=available[provider]['api_key'],
-            temperature=final_temperature,
-            max_tokens=final_max_tokens,
-            timeout=final_timeout,
-            drop_params=True,
-            additional_drop_params=["stop", "frequency_penalty", "presence_penalty"]
+        final_temperature = temperature if temperature is not None else record.temperature
+        final_max_tokens = max_tokens if max_tokens is not None else record.max_tokens
+        connect_timeout, read_timeout = _llm_timeout(record.timeout)
+        final_timeout = float(timeout) if timeout is not None else read_timeout
+        if provider not in _HTTPX_TIMEOUT_PROVIDERS:
+            connect_timeout = None
+        
+        # Provider-side prefix caching of the (stable) system prompt
+        cache_ttl = None
+        if cache_system_prompt and provider == 'anthropic':
+            cache_ttl = '1h' if cache_ttl_minutes >= 60 else '5m'
+        
+        # Canonical arguments -> shared LLM instance (see _build_llm)
+        llm = _build_llm(
+            record.model_name,
+            router.pick(),
+            final_temperature,
+            final_max_tokens,
+            final_timeout,
+            connect_timeout,
+            _llm_timeout_retries(),
+            cache_ttl
         )
+        
+        # Only LiteLLM-routed models read LiteLLM's shared client sessions
+        if getattr(llm, 'llm_type', None) == 'litellm' and not cls._http_clients:
+            cls.enable_shared_http_client(http2=os.getenv('HTTP2_ENABLED', '0') == '1')
+        
+        if single_flight:
+            from .single_flight import SingleFlightLLM
+            llm = SingleFlightLLM(llm)
+        
+        if semantic_cache:
+            from .semantic_cache import SemanticCachingLLM
+            embedder = semantic_cache if callable(semantic_cache) else None
+            llm = SemanticCachingLLM(llm, embedder=embedder)
+        
+        return llm
     
     @classmethod
-    def create_strict_llm(cls, provider: Optional[str] = None) -> LLM:
+    def create_strict_llm(cls, provider: Optional[str] = None) -> "LLM":
         """
         Create a strict LLM for minimal token usage.
         
@@ -250,7 +712,7 @@ class ModelConfig:
         )
     
     @classmethod
-    def create_standard_llm(cls, provider: Optional[str] = None) -> LLM:
+    def create_standard_llm(cls, provider: Optional[str] = None) -> "LLM":
         """
         Create a standard LLM for balanced usage.
         
@@ -262,6 +724,21 @@ class ModelConfig:
         """
         return cls.create_llm(provider=provider)
     
+    @classmethod
+    def create_batch_llm(cls, max_concurrency: int = 10, **kwargs):
+        """
+        Create an LLM that can fan out independent prompts concurrently.
+        
+        Args:
+            max_concurrency: Maximum number of in-flight provider calls
+            **kwargs: Forwarded to create_llm
+            
+        Returns:
+            BatchLLM wrapping the configured LLM instance
+        """
+        from .batch_llm import BatchLLM
+        return BatchLLM(cls.create_llm(**kwargs), max_concurrency=max_concurrency)
+    
     @classmethod
     def get_provider_info(cls) -> Dict[str, Any]:
         """
@@ -274,49 +751,176 @@ class ModelConfig:
         default_provider = cls.get_default_provider()
         
         info = {
-            'available_providers': list(available.keys()),
+            'available_providers': tuple(available),
             'default_provider': default_provider,
             'total_providers': len(available)
         }
         
         if default_provider:
             default_model = cls.get_default_model(default_provider)
+            record = _MODEL_TABLE[(default_provider, default_model)]
             info.update({
                 'default_model': default_model,
-                'provider_name': cls.MODEL_CONFIGS[default_provider]['provider_name'],
-                'cost_efficiency': cls.MODEL_CONFIGS[default_provider]['models'][default_model]['cost_efficiency']
+                'provider_name': record.provider_name,
+                'cost_efficiency': record.cost_efficiency
             })
         
         return info
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists to read-only mappings/tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _build_provider_table(model_configs: Mapping[str, Any]) -> Mapping[str, ProviderRecord]:
+    """Compile the nested MODEL_CONFIGS into read-only ProviderRecord/ModelRecord objects."""
+    return MappingProxyType({
+        provider: ProviderRecord(
+            models=MappingProxyType({
+                model: ModelRecord(
+                    model_name=model_config['model_name'],
+                    temperature=model_config['temperature'],
+                    max_tokens=model_config['max_tokens'],
+                    timeout=model_config['timeout'],
+                    cost_efficiency=model_config['cost_efficiency'],
+                    api_key_env=provider_config['api_key_env'],
+                    provider_name=provider_config['provider_name']
+                )
+                for model, model_config in provider_config['models'].items()
+            }),
+            api_key_env=provider_config['api_key_env'],
+            provider_name=provider_config['provider_name'],
+            fallback_providers=tuple(provider_config.get('fallback_providers', ()))
+        )
+        for provider, provider_config in model_configs.items()
+    })
+
+
+# Compiled configuration, built once at import; MODEL_CONFIGS stays as a
+# read-only view for backward compatibility
+_CFG = _build_provider_table(ModelConfig.MODEL_CONFIGS)
+ModelConfig.MODEL_CONFIGS = _freeze(ModelConfig.MODEL_CONFIGS)
+
+# Single-hash model lookup tables
+_MODEL_TABLE = {
+    (provider, model): record
+    for provider, provider_record in _CFG.items()
+    for model, record in provider_record.models.items()
+}
+_DEFAULT_MODEL = {
+    provider: next(iter(provider_record.models))
+    for provider, provider_record in _CFG.items()
+    if provider_record.models
+}
+
+
+# Weak handles on every LLM built, so their connection pools can be closed at exit
+_LIVE_LLMS: "weakref.WeakValueDictionary[int, LLM]" = weakref.WeakValueDictionary()
+
+
+@lru_cache(maxsize=32)
+def _build_llm(model_name: str,
+               api_key: str,
+               temperature: float,
+               max_tokens: int,
+               timeout: float,
+               connect_timeout: Optional[float],
+               num_retries: int,
+               cache_ttl: Optional[str]) -> "LLM":
+    """
+    Build (or reuse) an LLM for a fully resolved argument tuple.
+    
+    Arguments come from a small finite set (provider x model x preset x key),
+    so agents asking for the same preset share one client and its pool.
+    """
+    # Imported lazily: crewai is heavy and only needed once an LLM is built
+    from crewai import LLM
+    
+    extra_params = {}
+    if connect_timeout is not None:
+        # The SDK client takes precedence over the scalar timeout below
+        import httpx
+        extra_params['client_params'] = {'timeout': httpx.Timeout(timeout, connect=connect_timeout)}
+    if cache_ttl is not None:
+        extra_params['cache_control_injection_points'] = [{
+            'location': 'message',
+            'role': 'system',
+            'control': {'type': 'ephemeral', 'ttl': cache_ttl}
+        }]
+    
+    llm = LLM(
+        model=model_name,
+        api_key=api_key,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        # Short timeouts plus retries cut off heavy-tailed provider stalls
+        num_retries=num_retries,
+        drop_params=True,
+        additional_drop_params=_ADDITIONAL_DROP_PARAMS,
+        **extra_params
+    )
+    _LIVE_LLMS[id(llm)] = llm
+    return llm
+
+
+def _close_quietly(obj: Any) -> None:
+    """Call obj.close() if it exists, ignoring errors during interpreter shutdown."""
+    close = getattr(obj, 'close', None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            pass
+
+
+@atexit.register
+def _close_llms() -> None:
+    """Release pooled connections held by memoized LLMs and the pre-warm session."""
+    for llm in list(_LIVE_LLMS.values()):
+        _close_quietly(llm)
+        for attr in ('client', '_client'):
+            _close_quietly(getattr(llm, attr, None))
+    _LIVE_LLMS.clear()
+    _build_llm.cache_clear()
+    if _prewarm_session.cache_info().currsize:
+        _prewarm_session().close()
+    if ModelConfig._http_clients:
+        _close_quietly(ModelConfig._http_clients[0])
+
+
 # Convenience functions for backward compatibility
-def create_gemini_llm(temperature: float = 0.3, max_tokens: int = 300) -> LLM:
+def create_gemini_llm(temperature: float = 0.3, max_tokens: int = 300) -> "LLM":
     """Create Gemini LLM (backward compatibility)"""
     return ModelConfig.create_llm(provider='gemini', temperature=temperature, max_tokens=max_tokens)
 
 
-def create_gemini_llm_strict() -> LLM:
+def create_gemini_llm_strict() -> "LLM":
     """Create strict Gemini LLM (backward compatibility)"""
     return ModelConfig.create_strict_llm(provider='gemini')
 
 
-def create_gemini_llm_standard() -> LLM:
+def create_gemini_llm_standard() -> "LLM":
     """Create standard Gemini LLM (backward compatibility)"""
     return ModelConfig.create_standard_llm(provider='gemini')
 
 
 # New unified functions
-def create_llm(temperature: float = 0.3, max_tokens: int = 300) -> LLM:
+def create_llm(temperature: float = 0.3, max_tokens: int = 300) -> "LLM":
     """Create LLM with auto-detection (recommended)"""
     return ModelConfig.create_llm(temperature=temperature, max_tokens=max_tokens)
 
 
-def create_strict_llm() -> LLM:
+def create_strict_llm() -> "LLM":
     """Create strict LLM with auto-detection (recommended)"""
     return ModelConfig.create_strict_llm()
 
 
-def create_standard_llm() -> LLM:
+def create_standard_llm() -> "LLM":
     """Create standard LLM with auto-detection (recommended)"""
     return ModelConfig.create_standard_llm() 
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""
+Semantic Response Cache Module
+=============================
+
+Embedding-similarity response cache that sits in front of any LLM created
+by ModelConfig. Near-duplicate prompts are answered from a small in-memory
+vector index instead of paying for another provider round-trip.
+"""
+
+import re
+import json
+import time
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import PrivateAttr
+
+from .llm_wrapper import LLMWrapper
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Per-call arguments that do not change the answer and stay out of the cache key
+_UNKEYED_KWARGS = frozenset({'callbacks', 'from_task', 'from_agent'})
+
+
+def _canonicalize(prompt: str) -> str:
+    """Collapse whitespace so cosmetically different prompts share a cache entry."""
+    return _WHITESPACE_RE.sub(' ', prompt.strip())
+
+
+def _prompt_text(messages: Any) -> str:
+    """Flatten CrewAI/LiteLLM style messages into a single prompt string."""
+    if isinstance(messages, str):
+        return messages
+    if isinstance(messages, list):
+        parts = []
+        for msg in messages:
+            if isinstance(msg, dict) and 'content' in msg:
+                parts.append(f"{msg.get('role', 'user')}: {msg['content']}")
+            else:
+                parts.append(str(msg))
+        return "\n".join(parts)
+    return str(messages)
+
+
+def _call_scope(kwargs: Dict[str, Any]) -> str:
+    """Stable string for the call arguments (response_model, ...) that shape the answer."""
+    scope = {}
+    for name, value in kwargs.items():
+        if name in _UNKEYED_KWARGS or value is None:
+            continue
+        if isinstance(value, type):
+            value = f"{value.__module__}.{value.__qualname__}"
+        scope[name] = value
+    return json.dumps(scope, sort_keys=True, default=str)
+
+
+class SemanticCachingLLM(LLMWrapper):
+    """
+    Caching decorator around an LLM instance.
+
+    Without an embedder, a prompt only hits when its whitespace-normalized
+    text and call arguments match a cached entry exactly. With an embedder,
+    prompts are also compared against previously answered prompts with a
+    single matrix-vector product; when the best cosine similarity among
+    entries with the same call arguments reaches the threshold and the entry
+    has not expired, the stored response is returned without calling the
+    provider.
+    """
+
+    embedder: Optional[Callable[[str], Any]] = None
+    threshold: float = 0.92
+    ttl: float = 3600
+    capacity: int = 1024
+    strict: bool = False
+
+    # Contiguous (capacity, dim) embedding matrix, allocated on first insert
+    _matrix: Optional[np.ndarray] = PrivateAttr(default=None)
+    _expiry: np.ndarray = PrivateAttr()
+    _responses: List[Optional[str]] = PrivateAttr()
+    _keys: List[Optional[str]] = PrivateAttr()
+    _scopes: List[Optional[str]] = PrivateAttr()
+    _index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _size: int = PrivateAttr(default=0)
+    _next: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: Any) -> None:
+        """
+        Allocate the ring buffer.
+
+        Settings (all optional keyword arguments):
+            embedder: Callable mapping text to a 1-D vector; None caches exact
+                prompt matches only
+            threshold: Minimum cosine similarity for a cache hit
+            ttl: Entry lifetime in seconds
+            capacity: Maximum number of cached responses (oldest evicted first)
+            strict: Key prompts verbatim instead of whitespace-normalized
+                (for whitespace-sensitive templated prompts)
+        """
+        super().model_post_init(context)
+        self._expiry = np.zeros(self.capacity, dtype=np.float64)
+        self._responses = [None] * self.capacity
+        self._keys = [None] * self.capacity
+        self._scopes = [None] * self.capacity
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Embed text and normalize so dot products are cosine similarities."""
+        vector = np.asarray(self.embedder(text), dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def _lookup(self, key: str, scope: str, query: Optional[np.ndarray]) -> Optional[str]:
+        """Return the cached response for the key, or the closest one in scope."""
+        with self._lock:
+            now = time.monotonic()
+            idx = self._index.get(key)
+            if idx is not None and self._expiry[idx] >= now:
+                self._hits += 1
+                return self._responses[idx]
+
+            if query is not None and self._matrix is not None:
+                sims = self._matrix[:self._size] @ query
+                # Expired rows and rows made with other call arguments never match
+                sims[self._expiry[:self._size] < now] = -1.0
+                sims[np.array([s != scope for s in self._scopes[:self._size]])] = -1.0
+                idx = int(sims.argmax())
+                if sims[idx] >= self.threshold:
+                    self._hits += 1
+                    return self._responses[idx]
+
+            self._misses += 1
+            return None
+
+    def _insert(self, key: str, scope: str, query: Optional[np.ndarray], response: str) -> None:
+        """Store a response, overwriting the oldest row once at capacity."""
+        with self._lock:
+            idx = self._next
+            if self._keys[idx] is not None and self._index.get(self._keys[idx]) == idx:
+                del self._index[self._keys[idx]]
+
+            if query is not None:
+                if self._matrix is None:
+                    self._matrix = np.zeros((self.capacity, query.shape[0]), dtype=np.float32)
+                self._matrix[idx] = query
+            self._expiry[idx] = time.monotonic() + self.ttl
+            self._responses[idx] = response
+            self._keys[idx] = key
+            self._scopes[idx] = scope
+            self._index[key] = idx
+            self._next = (idx + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def _cache_entry(self, messages: Any, kwargs: Dict[str, Any]) -> Tuple[str, str, Optional[np.ndarray]]:
+        """Build the (key, scope, embedding) a call is looked up and stored under."""
+        prompt = _prompt_text(messages)
+        text = prompt if self.strict else _canonicalize(prompt)
+        scope = _call_scope({**kwargs, 'stop': self.stop_sequences or None})
+        query = self._embed(text) if self.embedder is not None else None
+        return f"{scope}\n{text}", scope, query
+
+    def call(self, messages: Any, **kwargs) -> Any:
+        """
+        Call the wrapped LLM, serving repeated or near-duplicate prompts from the cache.
+
+        Tool-calling requests bypass the cache since their results depend on
+        side effects rather than the prompt alone.
+
+        Args:
+            messages: Prompt string or list of chat messages
+            **kwargs: Forwarded to the wrapped LLM; response_model and the
+                other call settings are part of the cache key
+
+        Returns:
+            LLM response
+        """
+        if kwargs.get('tools') or kwargs.get('available_functions'):
+            return self._forward(messages, **kwargs)
+
+        entry = self._cache_entry(messages, kwargs)
+        cached = self._lookup(*entry)
+        if cached is not None:
+            return cached
+
+        response = self._forward(messages, **kwargs)
+        if isinstance(response, str):
+            self._insert(*entry, response)
+        return response
+
+    async def acall(self, messages: Any, **kwargs) -> Any:
+        """Async counterpart of call()."""
+        if kwargs.get('tools') or kwargs.get('available_functions'):
+            return await self._aforward(messages, **kwargs)
+
+        entry = self._cache_entry(messages, kwargs)
+        cached = self._lookup(*entry)
+        if cached is not None:
+            return cached
+
+        response = await self._aforward(messages, **kwargs)
+        if isinstance(response, str):
+            self._insert(*entry, response)
+        return response
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._matrix = None
+            self._expiry[:] = 0.0
+            self._responses = [None] * self.capacity
+            self._keys = [None] * self.capacity
+            self._scopes = [None] * self.capacity
+            self._index.clear()
+            self._size = 0
+            self._next = 0
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'size': self._size,
+                'capacity': self.capacity,
+                'threshold': self.threshold if self.embedder is not None else 1.0
+            }
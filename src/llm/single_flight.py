@@ -0,0 +1,105 @@
+"""
+Single-Flight LLM Module
+========================
+
+Request-coalescing wrapper for LLMs created by ModelConfig. When several
+agents issue the same prompt at the same time, only one provider call is
+made and its result is fanned back out to every waiter.
+"""
+
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from pydantic import PrivateAttr
+
+from .llm_wrapper import LLMWrapper
+
+
+# Per-call arguments that do not change the answer and stay out of the key
+_UNKEYED_KWARGS = frozenset({'callbacks', 'from_task', 'from_agent'})
+
+
+class _Call:
+    """One in-flight provider call shared by every identical request."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlightLLM(LLMWrapper):
+    """
+    Single-flight decorator around an LLM instance.
+
+    Concurrent call()s with identical messages and call settings share one
+    underlying call; sequential calls are not cached (see SemanticCachingLLM
+    for that).
+    """
+
+    _inflight: Dict[str, _Call] = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _coalesced: int = PrivateAttr(default=0)
+
+    def _key(self, messages: Any, kwargs: Dict[str, Any]) -> str:
+        """Stable key for the messages plus the call settings that shape the answer."""
+        settings = {
+            name: f"{value.__module__}.{value.__qualname__}" if isinstance(value, type) else value
+            for name, value in kwargs.items()
+            if name not in _UNKEYED_KWARGS and value is not None
+        }
+        settings['stop'] = self.stop_sequences
+        return json.dumps([messages, settings], sort_keys=True, default=str)
+
+    def call(self, messages: Any, **kwargs) -> Any:
+        """
+        Call the wrapped LLM, joining an identical in-flight call if one exists.
+
+        Tool-calling requests are never coalesced since they have side effects.
+
+        Args:
+            messages: Prompt string or list of chat messages
+            **kwargs: Forwarded to the wrapped LLM
+
+        Returns:
+            LLM response
+        """
+        if kwargs.get('tools') or kwargs.get('available_functions'):
+            return self._forward(messages, **kwargs)
+
+        key = self._key(messages, kwargs)
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._forward(messages, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request-coalescing statistics."""
+        with self._lock:
+            return {
+                'inflight': len(self._inflight),
+                'coalesced': self._coalesced
+            }
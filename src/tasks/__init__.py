@@ -5,6 +5,7 @@ Tasks Module
 Optimized market analysis tasks for minimal Gemini API usage.
 """
 
-from .market_analysis_tasks import create_market_analysis_tasks
+from .market_analysis_tasks import MarketAnalysisTasks, create_market_analysis_tasks
+from .parallel import kickoff_batch, run_all_parallel
 
-__all__ = ['create_market_analysis_tasks'] 
\ No newline at end of file
+__all__ = ['MarketAnalysisTasks', 'create_market_analysis_tasks', 'kickoff_batch', 'run_all_parallel'] 
\ No newline at end of file
@@ -5,89 +5,197 @@ Market Analysis Tasks Module
 Optimized market analysis tasks for minimal Gemini API usage.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Mapping, NamedTuple, Tuple
+
 from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+
+from ..agents import get_agent
+from .refs import compact_schema
+from .task_cache import CachedTask
+from .models import (
+    MarketSegmentsOutput,
+    ResearchSourcesOutput,
+    CompetitorProfilesOutput,
+    ExecutiveSummaryOutput
+)
+
 
+class MarketAnalysisTasks(NamedTuple):
+    """The market analysis tasks in execution order, with name-based access"""
+    market_segments: Task
+    research_sources: Task
+    competitor_analysis: Task
+    executive_summary: Task
 
-def create_market_analysis_tasks():
+
+def compact_output(output: TaskOutput) -> None:
     """
-    Create optimized market analysis tasks for minimal API usage
+    Replace a validated task output's raw text with minified JSON
     
-    Returns:
-        List of 4 optimized tasks
+    Downstream tasks receive raw outputs as context, so stripping prose,
+    code fences and indentation keeps the synthesis prompt small.
     """
-    
-    # Import agent creation functions here to avoid circular imports
-    from ..agents import create_archivist_agent, create_shadow_agent, create_nexus_agent
-    
-    # Task 1: Market Segments (Ultra-minimal)
-    identify_key_market_segments = Task(
-        description="List the top 3-4 market segments in enterprise LLM industry. For each segment, provide: name, brief description (1 sentence), and estimated market size.",
-        expected_output="""JSON with structure:
-        {
-          "segments": [
-            {
-              "name": "string",
-              "description": "string (1 sentence)",
-              "market_size": "string (e.g., $X billion)"
-            }
-          ]
-        }""",
-        agent=create_archivist_agent(),
+    if output.pydantic is not None:
+        output.raw = output.pydantic.model_dump_json()
+
+
+# Static prompts, built once at import and shared by every task instance
+_DESC_MARKET_SEGMENTS = "List the top 3-4 market segments in enterprise LLM industry. For each segment, provide: name, brief description (1 sentence), and estimated market size."
+_EXPECTED_MARKET_SEGMENTS = "JSON: " + compact_schema(MarketSegmentsOutput)
+_DESC_RESEARCH_SOURCES = "Find the top 3 most relevant recent sources (last 3 months) about enterprise LLM market. Focus on: adoption trends, key players, and market growth."
+_EXPECTED_RESEARCH_SOURCES = "JSON: " + compact_schema(ResearchSourcesOutput)
+_DESC_COMPETITOR_ANALYSIS = "Analyze the top 3 competitors in enterprise LLM market. For each: name, main strength, and market position."
+_EXPECTED_COMPETITOR_ANALYSIS = "JSON: " + compact_schema(CompetitorProfilesOutput)
+_DESC_EXECUTIVE_SUMMARY = "Create a 3-4 bullet point executive summary combining all previous findings. Focus on: key market insights, competitive landscape, and strategic recommendations."
+_EXPECTED_EXECUTIVE_SUMMARY = "JSON: " + compact_schema(ExecutiveSummaryOutput)
+
+
+# Task 1: Market Segments (Ultra-minimal; static prompt, cached across runs)
+def _market_segments_task(fresh: bool = False) -> Task:
+    """Build the market segments task"""
+    return CachedTask(
+        description=_DESC_MARKET_SEGMENTS,
+        expected_output=_EXPECTED_MARKET_SEGMENTS,
+        output_pydantic=MarketSegmentsOutput,
+        # Native structured output: the provider enforces the full schema and
+        # the prompt only carries the compact skeleton
+        response_model=MarketSegmentsOutput,
+        agent=get_agent('archivist', fresh),
+        # Tasks 1-3 are independent of each other and run concurrently
+        # (their LLM calls share LLM_MAX_CONCURRENT slots per provider)
+        async_execution=True,
+        callback=compact_output,
         output_key='market_segments'
     )
-    
-    # Task 2: Research Collection (Minimal)
-    collect_reports_news = Task(
-        description="Find the top 3 most relevant recent sources (last 3 months) about enterprise LLM market. Focus on: adoption trends, key players, and market growth.",
-        expected_output="""JSON with structure:
-        {
-          "sources": [
-            {
-              "title": "string",
-              "url": "string",
-              "key_finding": "string (1 sentence)"
-            }
-          ]
-        }""",
-        agent=create_archivist_agent(),
+
+
+# Task 2: Research Collection (Minimal; static prompt, cached across runs)
+def _research_sources_task(fresh: bool = False) -> Task:
+    """Build the research collection task"""
+    return CachedTask(
+        description=_DESC_RESEARCH_SOURCES,
+        expected_output=_EXPECTED_RESEARCH_SOURCES,
+        output_pydantic=ResearchSourcesOutput,
+        response_model=ResearchSourcesOutput,
+        # Runs concurrently with the market segments task, so it needs its own
+        # Archivist: crewai keeps the running task's state on the agent
+        agent=get_agent('archivist', fresh=True),
+        async_execution=True,
+        callback=compact_output,
         output_key='research_sources'
     )
-    
-    # Task 3: Competitor Analysis (Minimal)
-    profile_competitor = Task(
-        description="Analyze the top 3 competitors in enterprise LLM market. For each: name, main strength, and market position.",
-        expected_output="""JSON with structure:
-        {
-          "competitors": [
-            {
-              "name": "string",
-              "strength": "string (1 sentence)",
-              "position": "string (leader/challenger/niche)"
-            }
-          ]
-        }""",
-        agent=create_shadow_agent(),
+
+
+# Task 3: Competitor Analysis (Minimal; static prompt, cached across runs)
+def _competitor_analysis_task(fresh: bool = False) -> Task:
+    """Build the competitor analysis task"""
+    return CachedTask(
+        description=_DESC_COMPETITOR_ANALYSIS,
+        expected_output=_EXPECTED_COMPETITOR_ANALYSIS,
+        output_pydantic=CompetitorProfilesOutput,
+        response_model=CompetitorProfilesOutput,
+        agent=get_agent('shadow', fresh),
+        async_execution=True,
+        callback=compact_output,
         output_key='competitor_analysis'
     )
-    
-    # Task 4: Executive Summary (Synthesis)
-    compile_all = Task(
-        description="Create a 3-4 bullet point executive summary combining all previous findings. Focus on: key market insights, competitive landscape, and strategic recommendations.",
-        expected_output="""JSON with structure:
-        {
-          "summary": {
-            "key_insights": ["string (3-4 bullet points)"],
-            "competitive_landscape": "string (1 sentence)",
-            "recommendations": ["string (2-3 recommendations)"]
-          }
-        }""",
-        agent=create_nexus_agent(),
+
+
+# Task 4: Executive Summary (Synthesis; cached per research context)
+def _executive_summary_task(research: List[Task], fresh: bool = False) -> Task:
+    """Build the executive summary task over the research tasks"""
+    return CachedTask(
+        description=_DESC_EXECUTIVE_SUMMARY,
+        expected_output=_EXPECTED_EXECUTIVE_SUMMARY,
+        output_pydantic=ExecutiveSummaryOutput,
+        response_model=ExecutiveSummaryOutput,
+        agent=get_agent('nexus', fresh),
+        # Waits for the async research tasks (also used by run_all_parallel())
+        context=research,
         output_key='executive_summary'
     )
+
+
+# Prerequisites of each task (by MarketAnalysisTasks field), wired as Task.context
+_DEPS = MappingProxyType({
+    "market_segments": (),
+    "research_sources": (),
+    "competitor_analysis": (),
+    "executive_summary": ("market_segments", "research_sources", "competitor_analysis")
+})
+
+_TASK_FACTORIES = MappingProxyType({
+    "market_segments": _market_segments_task,
+    "research_sources": _research_sources_task,
+    "competitor_analysis": _competitor_analysis_task,
+    "executive_summary": _executive_summary_task
+})
+
+
+def _generations(deps: Mapping[str, Tuple[str, ...]]) -> Tuple[Tuple[str, ...], ...]:
+    """Group task names into generations whose members only depend on earlier ones"""
+    remaining = dict(deps)
+    done = set()
+    generations = []
+    while remaining:
+        generation = tuple(name for name, requires in remaining.items() if done.issuperset(requires))
+        if not generation:
+            raise ValueError("Task dependencies contain a cycle")
+        generations.append(generation)
+        done.update(generation)
+        for name in generation:
+            del remaining[name]
+    return tuple(generations)
+
+
+# Computed once at import; tasks within a generation are independent
+DEPENDENCY_GENERATIONS = _generations(_DEPS)
+
+
+def _build_task(name: str, built: Mapping[str, Task], fresh: bool) -> Task:
+    """Build a task, passing its already built prerequisites as context"""
+    context = [built[dep] for dep in _DEPS[name]]
+    if context:
+        return _TASK_FACTORIES[name](context, fresh=fresh)
+    return _TASK_FACTORIES[name](fresh=fresh)
+
+
+def create_market_analysis_tasks(fresh_agents: bool = False) -> MarketAnalysisTasks:
+    """
+    Create optimized market analysis tasks for minimal API usage
+    
+    Every call builds new Task objects (crewai keeps per-run state such as
+    the output on the Task); only the static prompts and schemas above are
+    shared. Tasks are constructed generation by generation (see
+    DEPENDENCY_GENERATIONS); independent tasks (and their agents/LLMs) are
+    constructed concurrently.
+    
+    Args:
+        fresh_agents: Give the tasks new, unshared agents instead of the
+            registry's shared ones (for crews that run concurrently)
+    
+    Returns:
+        MarketAnalysisTasks with the 4 optimized tasks
+    """
+    built = {}
+    with ThreadPoolExecutor(max_workers=max(map(len, DEPENDENCY_GENERATIONS))) as pool:
+        for generation in DEPENDENCY_GENERATIONS:
+            futures = {name: pool.submit(_build_task, name, built, fresh_agents) for name in generation}
+            built.update((name, future.result()) for name, future in futures.items())
     
-    return [
-        identify_key_market_segments,
-        collect_reports_news,
-        profile_competitor,
-        compile_all
-    ] 
\ No newline at end of file
+    return MarketAnalysisTasks(**built)
+
+
+def __getattr__(name: str) -> Task:
+    """
+    Lazily expose each task as a module attribute (PEP 562), e.g. `executive_summary`
+    
+    Each access builds a new task set; use create_market_analysis_tasks() to
+    get tasks that belong to the same run.
+    """
+    if name in MarketAnalysisTasks._fields:
+        return getattr(create_market_analysis_tasks(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
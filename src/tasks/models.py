@@ -0,0 +1,57 @@
+"""
+Task Output Models Module
+========================
+
+Pydantic models for the structured outputs of the market analysis tasks.
+"""
+
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class MarketSegment(BaseModel):
+    """One enterprise LLM market segment"""
+    name: str
+    description: str = Field(..., description="1 sentence")
+    market_size: str = Field(..., description="e.g., $X billion")
+
+
+class MarketSegmentsOutput(BaseModel):
+    """Output schema for the market segments task"""
+    segments: List[MarketSegment]
+
+
+class ResearchSource(BaseModel):
+    """One recent source about the enterprise LLM market"""
+    title: str
+    url: str
+    key_finding: str = Field(..., description="1 sentence")
+
+
+class ResearchSourcesOutput(BaseModel):
+    """Output schema for the research collection task"""
+    sources: List[ResearchSource]
+
+
+class Competitor(BaseModel):
+    """One competitor profile"""
+    name: str
+    strength: str = Field(..., description="1 sentence")
+    position: str = Field(..., description="leader/challenger/niche")
+
+
+class CompetitorProfilesOutput(BaseModel):
+    """Output schema for the competitor analysis task"""
+    competitors: List[Competitor]
+
+
+class ExecutiveSummary(BaseModel):
+    """Synthesized findings"""
+    key_insights: List[str] = Field(..., description="3-4 bullet points")
+    competitive_landscape: str = Field(..., description="1 sentence")
+    recommendations: List[str] = Field(..., description="2-3 recommendations")
+
+
+class ExecutiveSummaryOutput(BaseModel):
+    """Output schema for the executive summary task"""
+    summary: ExecutiveSummary
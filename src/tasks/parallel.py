@@ -0,0 +1,140 @@
+"""
+Parallel Task Execution Module
+=============================
+
+Runs market analysis tasks level by level over their context dependencies,
+so independent tasks overlap and the critical path is the longest chain
+instead of the sum of all tasks, and runs whole crews over many inputs.
+"""
+
+import os
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from crewai import Crew, Process, Task
+from crewai.tasks.task_output import TaskOutput
+
+
+# Concurrent tasks per level (keep within the provider's rate limit; agent
+# calls are additionally capped per provider by LLM_MAX_CONCURRENT)
+DEFAULT_MAX_CONCURRENCY = int(os.getenv('MAX_CONCURRENT_TASKS', '3'))
+
+# Concurrent crew runs in kickoff_batch
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+def _dependencies(task: Task) -> List[Task]:
+    """Upstream tasks declared through Task.context (none if unspecified)."""
+    return task.context if isinstance(task.context, list) else []
+
+
+def dependency_levels(tasks: Sequence[Task]) -> List[List[Task]]:
+    """
+    Group tasks into levels whose members only depend on earlier levels
+
+    Args:
+        tasks: Tasks to schedule
+
+    Returns:
+        List of levels in execution order
+
+    Raises:
+        ValueError: If the context dependencies contain a cycle
+    """
+    scheduled = {id(task) for task in tasks}
+    remaining = list(tasks)
+    done = set()
+    levels = []
+
+    while remaining:
+        level = [
+            task for task in remaining
+            if all(id(dep) in done for dep in _dependencies(task) if id(dep) in scheduled)
+        ]
+        if not level:
+            raise ValueError("Task context dependencies contain a cycle")
+        levels.append(level)
+        done.update(id(task) for task in level)
+        remaining = [task for task in remaining if id(task) not in done]
+
+    return levels
+
+
+async def run_all_parallel(tasks: Optional[Sequence[Task]] = None,
+                           max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[TaskOutput]:
+    """
+    Execute tasks concurrently wherever their dependencies allow
+
+    Each level runs with asyncio.gather (blocking task execution happens on
+    worker threads); a task receives the raw outputs of its context tasks.
+
+    Args:
+        tasks: Tasks to run (create_market_analysis_tasks() if None)
+        max_concurrency: Maximum number of tasks executing at once
+
+    Returns:
+        Task outputs in the same order as tasks
+    """
+    if tasks is None:
+        from .market_analysis_tasks import create_market_analysis_tasks
+        tasks = create_market_analysis_tasks()
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+    outputs = {}
+
+    async def _run(task: Task) -> TaskOutput:
+        context = "\n\n".join(outputs[id(dep)].raw for dep in _dependencies(task) if id(dep) in outputs)
+        async with semaphore:
+            return await loop.run_in_executor(None, lambda: task.execute_sync(context=context or None))
+
+    for level in dependency_levels(tasks):
+        results = await asyncio.gather(*[_run(task) for task in level])
+        outputs.update((id(task), result) for task, result in zip(level, results))
+
+    return [outputs[id(task)] for task in tasks]
+
+
+def _default_crew() -> Crew:
+    """New crew over unshared default agents and fresh market analysis tasks."""
+    from .market_analysis_tasks import create_market_analysis_tasks
+
+    tasks = list(create_market_analysis_tasks(fresh_agents=True))
+    return Crew(
+        # Agents the tasks run on (concurrent tasks each have their own instance)
+        agents=list({id(task.agent): task.agent for task in tasks}.values()),
+        tasks=tasks,
+        process=Process.sequential
+    )
+
+
+async def kickoff_batch(inputs: Sequence[Dict[str, Any]],
+                        crew_factory: Optional[Callable[[], Crew]] = None,
+                        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+                        fail_fast: bool = True) -> List[Any]:
+    """
+    Run a crew once per input concurrently (an async kickoff_for_each)
+
+    Each run gets a newly built crew, so runs share no tasks or agents
+    (crewai keeps per-run state on both); provider calls stay capped by
+    LLM_MAX_CONCURRENT.
+
+    Args:
+        inputs: One kickoff inputs dict per run
+        crew_factory: Zero-argument callable building a new crew for each run
+            (the default market analysis crew if None)
+        concurrency: Maximum number of runs in flight
+        fail_fast: Raise the first error; otherwise errors are returned in place of results
+
+    Returns:
+        Crew outputs in the same order as inputs
+    """
+    crew_factory = crew_factory or _default_crew
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run_one(run_inputs: Dict[str, Any]) -> Any:
+        async with semaphore:
+            return await crew_factory().kickoff_async(inputs=run_inputs)
+
+    return await asyncio.gather(*[_run_one(run_inputs) for run_inputs in inputs],
+                                return_exceptions=not fail_fast)
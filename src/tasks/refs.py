@@ -0,0 +1,75 @@
+"""
+Schema Reference Module
+======================
+
+Resolves JSON-pointer "$ref"s in the task output schemas and renders them
+as minified JSON skeletons for expected_output.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+
+
+def _lookup(root: Dict[str, Any], ref: str) -> Any:
+    """Follow a local JSON pointer such as '#/$defs/MarketSegment'."""
+    if not ref.startswith("#/"):
+        raise ValueError(f"Only local schema references are supported: {ref}")
+    node = root
+    for part in ref[2:].split("/"):
+        node = node[part.replace("~1", "/").replace("~0", "~")]
+    return node
+
+
+def resolve_refs(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Inline every "$ref" of a JSON schema and drop its definitions
+
+    Args:
+        schema: JSON schema (e.g. BaseModel.model_json_schema())
+
+    Returns:
+        Self-contained schema without "$ref"/"$defs"
+    """
+    def _resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return _resolve(_lookup(schema, node["$ref"]))
+            return {key: _resolve(value) for key, value in node.items() if key != "$defs"}
+        if isinstance(node, list):
+            return [_resolve(item) for item in node]
+        return node
+
+    return _resolve(schema)
+
+
+def _skeleton(node: Dict[str, Any]) -> Any:
+    """Render a resolved schema node as an example-shaped value."""
+    if node.get("type") == "object" or "properties" in node:
+        return {name: _skeleton(prop) for name, prop in node.get("properties", {}).items()}
+    if node.get("type") == "array":
+        item = _skeleton(node.get("items", {}))
+        if isinstance(item, str) and node.get("description"):
+            item += f" ({node['description']})"
+        return [item]
+    hint = node.get("type", "string")
+    if node.get("description"):
+        hint += f" ({node['description']})"
+    return hint
+
+
+@lru_cache(maxsize=None)
+def compact_schema(model: Type[BaseModel]) -> str:
+    """
+    Minified JSON skeleton of a task output model
+
+    Args:
+        model: Pydantic output model
+
+    Returns:
+        e.g. '{"segments":[{"name":"string","description":"string (1 sentence)"}]}'
+    """
+    skeleton = _skeleton(resolve_refs(model.model_json_schema()))
+    return json.dumps(skeleton, separators=(",", ":"))
@@ -0,0 +1,204 @@
+"""
+Task Result Cache Module
+=======================
+
+Persistent cache of task outputs keyed on the task prompt, so tasks whose
+inputs do not change between crew runs skip their LLM calls on re-runs.
+Set CREW_CACHE=0 to always call the agents.
+"""
+
+import os
+import json
+import time
+import hashlib
+from typing import Any, List, Optional
+
+from crewai import Task
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.task_events import TaskStartedEvent, TaskCompletedEvent
+from crewai.tasks.task_output import TaskOutput
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+
+# Cache location, entry lifetime (seconds) and size cap (bytes, LRU-evicted)
+TASK_CACHE_DIR = os.path.join("output", ".task_cache")
+TASK_CACHE_TTL = 7 * 24 * 3600
+TASK_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a cache entry (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a cache entry (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def cache_enabled() -> bool:
+    """Check whether task results may be served from the cache (CREW_CACHE, default on)."""
+    return os.getenv("CREW_CACHE", "1") != "0"
+
+
+class TaskResultCache:
+    """Disk-backed map from a task fingerprint to its raw output."""
+
+    def __init__(self, cache_dir: str = TASK_CACHE_DIR, ttl: float = TASK_CACHE_TTL,
+                 max_bytes: int = TASK_CACHE_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per entry
+            ttl: Entry lifetime in seconds
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(description: str, expected_output: str, context: Optional[str], model: str = "") -> str:
+        """Fingerprint of a task prompt, its upstream context and the model answering it."""
+        payload = "\0".join((description, expected_output, context or "", model))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached raw output, or None if missing or expired."""
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created", 0) > self.ttl:
+            return None
+        try:
+            # The file mtime records last use for LRU eviction
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        return entry.get("raw")
+
+    def put(self, key: str, raw: str) -> None:
+        """Store a raw output (atomic replace, safe under concurrent tasks)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps({"created": time.time(), "raw": raw}))
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        """Drop an entry (e.g. one that no longer parses)."""
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+_TASK_CACHE = TaskResultCache()
+
+
+class CachedTask(Task):
+    """
+    Task that reuses its previous output while the cache entry is fresh
+
+    Use for tasks that depend only on static descriptions and their context
+    (which is part of the key); on a hit the agent is not invoked at all (and takes no
+    provider concurrency slot).
+    """
+
+    def _cached_output(self, agent: Any, context: Optional[str]) -> Optional[TaskOutput]:
+        """Build the task output from the cache, if there is a hit."""
+        if not cache_enabled():
+            return None
+        agent = agent or self.agent
+        key = self._cache_key(agent, context)
+        raw = _TASK_CACHE.get(key)
+        if raw is None:
+            return None
+
+        try:
+            pydantic = self.output_pydantic.model_validate_json(raw) if self.output_pydantic else None
+        except ValueError:
+            # Stale or unparseable entry (pydantic's ValidationError is a ValueError):
+            # treat as a miss and drop it so the next run does not retry it
+            _TASK_CACHE.delete(key)
+            return None
+
+        crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
+        output = TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=raw,
+            pydantic=pydantic,
+            agent=agent.role if agent else ""
+        )
+        self.output = output
+        if self.callback:
+            self.callback(output)
+        crewai_event_bus.emit(self, TaskCompletedEvent(output=output, task=self))
+        return output
+
+    def _cache_key(self, agent: Any, context: Optional[str]) -> str:
+        # Outputs of one provider/model are never served after switching to another
+        llm = getattr(agent, "llm", None)
+        model = f"{getattr(llm, 'provider', '')}/{getattr(llm, 'model', '')}" if llm is not None else ""
+        return _TASK_CACHE.key(self.description, self.expected_output, context, model)
+
+    def _store_output(self, output: TaskOutput, agent: Any, context: Optional[str]) -> None:
+        # An output that failed conversion to output_pydantic would fail again on every hit
+        if self.output_pydantic and output.pydantic is None:
+            return
+        _TASK_CACHE.put(self._cache_key(agent or self.agent, context), output.raw)
+
+    def _execute_core(self, agent: Any, context: Optional[str], tools: Optional[List[Any]]) -> TaskOutput:
+        cached = self._cached_output(agent, context)
+        if cached is not None:
+            return cached
+        output = super()._execute_core(agent, context, tools)
+        self._store_output(output, agent, context)
+        return output
+
+    async def _aexecute_core(self, agent: Any, context: Optional[str], tools: Optional[List[Any]]) -> TaskOutput:
+        cached = self._cached_output(agent, context)
+        if cached is not None:
+            return cached
+        output = await super()._aexecute_core(agent, context, tools)
+        self._store_output(output, agent, context)
+        return output
@@ -7,12 +7,81 @@ and task descriptions while maintaining token optimization and API usage efficie
 """
 
 import re
-from typing import Dict, Any, List, Optional
-from string import Template
+import sys
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import tiktoken
+except ImportError:  # optional: fall back to the 4-characters-per-token estimate
+    tiktoken = None
 
 from src.company_profile import CompanyProfile
 
 
+# ${name} placeholders, compiled once for every injector
+_PLACEHOLDER_RE = re.compile(r'\$\{(\w+)\}')
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """BPE encoding used for token counts (None if tiktoken is unavailable)."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception:
+        # The encoding file is downloaded on first use and may be unreachable
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _tokens(text: str) -> int:
+    """Count the tokens of a text (cached, since the same templates recur)."""
+    encoding = _encoding()
+    if encoding is None:
+        # Rough approximation: 1 token ≈ 4 characters
+        return len(text) // 4
+    return len(encoding.encode(text))
+
+
+# Industry keywords -> research focus areas, checked in order
+_INDUSTRY_FOCUS = (
+    (('tech', 'software'), "technology trends, innovation, digital transformation"),
+    (('health',), "healthcare regulations, patient outcomes, medical technology"),
+    (('finance',), "financial regulations, fintech innovation, risk management"),
+    (('retail',), "e-commerce trends, customer experience, supply chain")
+)
+_DEFAULT_INDUSTRY_FOCUS = "industry trends, market dynamics, competitive landscape"
+
+# Compact stand-ins for the verbose placeholders (see _replace_complex_placeholders)
+_COMPACT_PLACEHOLDERS = {
+    'context_summary': '${compact_context}',
+    'products_services': '${company_name} products',
+    'competitive_advantages': '${company_name} advantages',
+    'current_challenges': '${company_name} challenges',
+    'research_focus_areas': '${research_focus}'
+}
+
+# Token gap between the largest and smallest placeholder values above which
+# only the largest ones are compacted (see ContextInjector._choose_mode)
+COMPACT_GAP_TOKENS = 20
+
+# Characters of the company description kept in compact injection (as in
+# CompanyProfile.get_compact_context)
+COMPACT_DESCRIPTION_CHARS = 100
+
+# Profile list fields exposed as comma-joined context variables
+_LIST_FIELDS = (
+    'target_customers',
+    'products_services',
+    'main_competitors',
+    'competitive_advantages',
+    'current_challenges',
+    'strategic_goals',
+    'research_focus_areas'
+)
+
+
 class ContextInjector:
     """
     Smart context injection system for company-specific personalization.
@@ -30,7 +99,16 @@ class ContextInjector:
             company_profile: CompanyProfile instance with company information
         """
         self.profile = company_profile
-        self.context_vars = self._build_context_variables()
+        self._industry_lc = company_profile.industry.lower()
+        # Joined once and shared by every context variable built from them
+        self._joined = {field: ', '.join(getattr(company_profile, field)) for field in _LIST_FIELDS}
+        # Interned: the same values are looked up and copied into every template
+        self.context_vars = {
+            sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+            for key, value in self._build_context_variables().items()
+        }
+        self._build_role_contexts()
+        self._build_compact_variables()
     
     def _build_context_variables(self) -> Dict[str, str]:
         """
@@ -46,19 +124,19 @@ class ContextInjector:
             'company_description': self.profile.company_description,
             
             # Business context
-            'target_customers': ', '.join(self.profile.target_customers),
-            'products_services': ', '.join(self.profile.products_services),
+            'target_customers': self._joined['target_customers'],
+            'products_services': self._joined['products_services'],
             'business_model': self.profile.business_model,
             
             # Competitive intelligence
-            'main_competitors': ', '.join(self.profile.main_competitors),
-            'competitive_advantages': ', '.join(self.profile.competitive_advantages),
+            'main_competitors': self._joined['main_competitors'],
+            'competitive_advantages': self._joined['competitive_advantages'],
             'market_position': self.profile.market_position,
             
             # Strategic priorities
-            'current_challenges': ', '.join(self.profile.current_challenges),
-            'strategic_goals': ', '.join(self.profile.strategic_goals),
-            'research_focus_areas': ', '.join(self.profile.research_focus_areas),
+            'current_challenges': self._joined['current_challenges'],
+            'strategic_goals': self._joined['strategic_goals'],
+            'research_focus_areas': self._joined['research_focus_areas'],
             
             # Compact versions for token optimization
             'compact_context': self.profile.get_compact_context(),
@@ -70,20 +148,76 @@ class ContextInjector:
             'strategic_focus': self._get_strategic_focus()
         }
     
+    @staticmethod
+    def _substitute(template: str, variables: Dict[str, str]) -> str:
+        """
+        Replace ${name} placeholders in one regex pass, leaving unknown ones as-is.
+        
+        Args:
+            template: Template string with ${name} placeholders
+            variables: Placeholder values
+            
+        Returns:
+            Template with known placeholders substituted
+        """
+        return _PLACEHOLDER_RE.sub(lambda m: variables.get(m.group(1), m.group(0)), template)
+    
+    def _build_compact_variables(self) -> None:
+        """Precompute the compact-injection variables and list item selection."""
+        # Each list's highest-scoring items, up to the list's limit
+        self._compact_lists = {
+            'target_customers': (self.profile.target_customers, 2),
+            'main_competitors': (self.profile.main_competitors, 2),
+            'strategic_goals': (self.profile.strategic_goals, 1),
+            'research_focus': (self.profile.research_focus_areas, 2)
+        }
+        self._compact_selected = {}
+        included = set()
+        for name, (items, limit) in self._compact_lists.items():
+            ranked = sorted(self._score_items(items, included), key=lambda item: -item[1])[:limit]
+            self._compact_selected[name] = ranked
+            included.update(items[index].strip().lower() for index, _ in ranked)
+        
+        self._compact_vars = {
+            'company_name': self.profile.company_name,
+            'industry': self.profile.industry,
+            'company_description': self._compact_description(),
+            'compact_context': self.profile.get_compact_context()
+        }
+        for name, ranked in self._compact_selected.items():
+            items = self._compact_lists[name][0]
+            self._compact_vars[name] = ', '.join(items[index] for index in sorted(index for index, _ in ranked))
+    
+    def _compact_description(self) -> str:
+        """Company description cut to the length used by the profile's compact context."""
+        description = self.profile.company_description
+        if len(description) <= COMPACT_DESCRIPTION_CHARS:
+            return description
+        return f"{description[:COMPACT_DESCRIPTION_CHARS]}..."
+    
+    def _build_role_contexts(self) -> None:
+        """Precompute the per-agent and per-task contexts (the profile does not change)."""
+        self._agent_contexts = {
+            'archivist': f"Specialized in {self.profile.industry} market research for {self.profile.company_name}. Focus on {', '.join(self.profile.research_focus_areas[:2])}.",
+            'shadow': f"Expert in competitive analysis for {self.profile.company_name} against {', '.join(self.profile.main_competitors[:2])}. Understands {self.profile.market_position}.",
+            'nexus': f"Strategic advisor for {self.profile.company_name} with focus on {', '.join(self.profile.strategic_goals[:2])}. Addresses challenges: {', '.join(self.profile.current_challenges[:2])}."
+        }
+        self._default_agent_context = f"Expert in {self.profile.industry} for {self.profile.company_name}."
+        
+        self._task_contexts = {
+            'market_segments': f"Focus on {self.profile.industry} segments relevant to {self.profile.company_name} and {', '.join(self.profile.target_customers[:2])}.",
+            'research': f"Research sources for {self.profile.company_name} in {self.profile.industry}, focusing on {', '.join(self.profile.research_focus_areas[:2])}.",
+            'competitor': f"Analyze {', '.join(self.profile.main_competitors[:3])} for {self.profile.company_name} competitive positioning.",
+            'summary': f"Executive summary for {self.profile.company_name} focusing on {', '.join(self.profile.strategic_goals[:2])} and {', '.join(self.profile.research_focus_areas[:2])}."
+        }
+        self._default_task_context = f"Analysis for {self.profile.company_name} in {self.profile.industry}."
+    
     def _get_industry_focus(self) -> str:
         """Get industry-specific focus areas."""
-        industry = self.profile.industry.lower()
-        
-        if 'tech' in industry or 'software' in industry:
-            return "technology trends, innovation, digital transformation"
-        elif 'health' in industry:
-            return "healthcare regulations, patient outcomes, medical technology"
-        elif 'finance' in industry:
-            return "financial regulations, fintech innovation, risk management"
-        elif 'retail' in industry:
-            return "e-commerce trends, customer experience, supply chain"
-        else:
-            return "industry trends, market dynamics, competitive landscape"
+        for keywords, focus in _INDUSTRY_FOCUS:
+            if any(keyword in self._industry_lc for keyword in keywords):
+                return focus
+        return _DEFAULT_INDUSTRY_FOCUS
     
     def _get_competitive_focus(self) -> str:
         """Get competitive intelligence focus areas."""
@@ -103,59 +237,121 @@ class ContextInjector:
         
         Args:
             template: Template string with placeholders like ${company_name}
-            token_budget: Maximum tokens to add (default: 150)
+            token_budget: Maximum tokens to add (default: 150); templates that
+                exceed it even when targeted get the compact context, which
+                is the smallest form and may still be over budget
             
         Returns:
             Template with injected context, optimized for token usage
         """
+        # Static text (e.g. a fixed backstory) has nothing to inject
+        if '${' not in template:
+            return template
+        
         # First, try full context injection
-        try:
-            result = Template(template).safe_substitute(self.context_vars)
-            
-            # Estimate token usage (rough approximation: 1 token ≈ 4 characters)
-            estimated_tokens = len(result) // 4
-            
-            if estimated_tokens <= token_budget:
+        result = self._substitute(template, self.context_vars)
+        
+        estimated_tokens = _tokens(result)
+        
+        if estimated_tokens <= token_budget:
+            return result
+        
+        # If token budget exceeded, compact only the values that dominate the
+        # template when there are some, and everything otherwise
+        mode, offenders = self._choose_mode(template)
+        if mode == 'targeted':
+            result = self._inject_targeted_context(template, offenders)
+            if _tokens(result) <= token_budget:
                 return result
+        
+        return self._inject_compact_context(template)
+    
+    def _choose_mode(self, template: str) -> Tuple[str, List[str]]:
+        """
+        Decide how to shrink a template that exceeds its token budget.
+        
+        Compares the token sizes of the template's placeholder values: if the
+        top quartile is much larger than the bottom one, compacting just those
+        placeholders keeps the rest of the context at full detail.
+        
+        Args:
+            template: Template string
             
-        except Exception:
-            pass
+        Returns:
+            ('targeted', largest placeholder names) or ('compact', [])
+        """
+        sizes = sorted(
+            ((_tokens(self.context_vars[name]), name)
+             for name in set(_PLACEHOLDER_RE.findall(template)) if name in self.context_vars),
+            reverse=True
+        )
+        if len(sizes) < 2:
+            return 'compact', []
         
-        # If token budget exceeded, use compact injection
-        return self._inject_compact_context(template, token_budget)
+        k = max(1, len(sizes) // 4)
+        if sizes[k - 1][0] - sizes[-k][0] < COMPACT_GAP_TOKENS:
+            return 'compact', []
+        return 'targeted', [name for _, name in sizes[:k]]
     
-    def _inject_compact_context(self, template: str, token_budget: int) -> str:
+    def _inject_targeted_context(self, template: str, offenders: List[str]) -> str:
         """
-        Inject compact context to stay within token budget.
+        Inject full context except for the given placeholders, which get their compact form.
         
         Args:
             template: Template string
-            token_budget: Maximum tokens to add
+            offenders: Placeholder names to compact
             
         Returns:
-            Template with compact context injection
+            Template with injected context
         """
-        # Create compact context variables
-        compact_vars = {
-            'company_name': self.profile.company_name,
-            'industry': self.profile.industry,
-            'compact_context': self.profile.get_compact_context(),
-            'target_customers': ', '.join(self.profile.target_customers[:2]),
-            'main_competitors': ', '.join(self.profile.main_competitors[:2]),
-            'strategic_goals': ', '.join(self.profile.strategic_goals[:1]),
-            'research_focus': ', '.join(self.profile.research_focus_areas[:2])
-        }
+        # Offenders with a compact stand-in are rewritten to it; the others
+        # (e.g. target_customers) get their compact value directly
+        template = _PLACEHOLDER_RE.sub(
+            lambda m: _COMPACT_PLACEHOLDERS.get(m.group(1), m.group(0)) if m.group(1) in offenders else m.group(0),
+            template
+        )
+        return self._substitute(template, {
+            **self.context_vars,
+            **{name: self._compact_vars[name] for name in offenders if name in self._compact_vars},
+            'research_focus': self._compact_vars['research_focus']
+        })
+    
+    def _inject_compact_context(self, template: str) -> str:
+        """
+        Inject compact context, the smallest form of every placeholder.
         
+        Args:
+            template: Template string
+            
+        Returns:
+            Template with compact context injection
+        """
         # Replace complex placeholders with compact versions
-        template = self._replace_complex_placeholders(template, compact_vars)
+        template = self._replace_complex_placeholders(template, self._compact_vars)
         
-        # Apply compact substitution
-        try:
-            result = Template(template).safe_substitute(compact_vars)
-            return result
-        except Exception:
-            # Fallback: return template with minimal substitution
-            return template.replace('${company_name}', self.profile.company_name)
+        # Apply compact substitution (precomputed variables: each list keeps its
+        # fixed item count, filled with its highest-scoring items)
+        return self._substitute(template, self._compact_vars)
+    
+    @staticmethod
+    def _score_items(items: List[str], included: set) -> List[tuple]:
+        """
+        Score profile list items for compact injection.
+        
+        Earlier items are treated as higher priority (score 1/(1+i)); an item
+        repeating one already included from another list scores much lower.
+        
+        Args:
+            items: List items in the order the company provided them
+            included: Lowercased items already selected
+            
+        Returns:
+            List of (index, score) pairs
+        """
+        return [
+            (index, (0.25 if item.strip().lower() in included else 1.0) / (1 + index))
+            for index, item in enumerate(items)
+        ]
     
     def _replace_complex_placeholders(self, template: str, compact_vars: Dict[str, str]) -> str:
         """
@@ -168,22 +364,11 @@ class ContextInjector:
         Returns:
             Template with simplified placeholders
         """
-        # Replace complex placeholders with simpler ones
-        replacements = {
-            '${context_summary}': '${compact_context}',
-            '${target_customers}': '${target_customers}',
-            '${products_services}': '${company_name} products',
-            '${main_competitors}': '${main_competitors}',
-            '${competitive_advantages}': '${company_name} advantages',
-            '${current_challenges}': '${company_name} challenges',
-            '${strategic_goals}': '${strategic_goals}',
-            '${research_focus_areas}': '${research_focus}'
-        }
-        
-        for old, new in replacements.items():
-            template = template.replace(old, new)
-        
-        return template
+        # Replace complex placeholders with simpler ones in a single pass
+        return _PLACEHOLDER_RE.sub(
+            lambda m: _COMPACT_PLACEHOLDERS.get(m.group(1), m.group(0)),
+            template
+        )
     
     def get_agent_context(self, agent_type: str) -> str:
         """
@@ -195,13 +380,7 @@ class ContextInjector:
         Returns:
             Company-specific context string for agent
         """
-        contexts = {
-            'archivist': f"Specialized in {self.profile.industry} market research for {self.profile.company_name}. Focus on {', '.join(self.profile.research_focus_areas[:2])}.",
-            'shadow': f"Expert in competitive analysis for {self.profile.company_name} against {', '.join(self.profile.main_competitors[:2])}. Understands {self.profile.market_position}.",
-            'nexus': f"Strategic advisor for {self.profile.company_name} with focus on {', '.join(self.profile.strategic_goals[:2])}. Addresses challenges: {', '.join(self.profile.current_challenges[:2])}."
-        }
-        
-        return contexts.get(agent_type, f"Expert in {self.profile.industry} for {self.profile.company_name}.")
+        return self._agent_contexts.get(agent_type, self._default_agent_context)
     
     def get_task_context(self, task_type: str) -> str:
         """
@@ -213,14 +392,7 @@ class ContextInjector:
         Returns:
             Company-specific context string for task
         """
-        contexts = {
-            'market_segments': f"Focus on {self.profile.industry} segments relevant to {self.profile.company_name} and {', '.join(self.profile.target_customers[:2])}.",
-            'research': f"Research sources for {self.profile.company_name} in {self.profile.industry}, focusing on {', '.join(self.profile.research_focus_areas[:2])}.",
-            'competitor': f"Analyze {', '.join(self.profile.main_competitors[:3])} for {self.profile.company_name} competitive positioning.",
-            'summary': f"Executive summary for {self.profile.company_name} focusing on {', '.join(self.profile.strategic_goals[:2])} and {', '.join(self.profile.research_focus_areas[:2])}."
-        }
-        
-        return contexts.get(task_type, f"Analysis for {self.profile.company_name} in {self.profile.industry}.")
+        return self._task_contexts.get(task_type, self._default_task_context)
     
     def validate_template(self, template: str) -> List[str]:
         """
@@ -236,7 +408,7 @@ class ContextInjector:
         
         # Check for valid placeholders
         valid_placeholders = set(self.context_vars.keys())
-        found_placeholders = re.findall(r'\$\{(\w+)\}', template)
+        found_placeholders = _PLACEHOLDER_RE.findall(template)
         
         for placeholder in found_placeholders:
             if placeholder not in valid_placeholders:
@@ -258,12 +430,9 @@ class ContextInjector:
         Returns:
             Estimated token count
         """
-        try:
-            result = Template(template).safe_substitute(self.context_vars)
-            # Rough approximation: 1 token ≈ 4 characters
-            return len(result) // 4
-        except Exception:
-            return len(template) // 4
+        if '${' not in template:
+            return _tokens(template)
+        return _tokens(self._substitute(template, self.context_vars))
 
 
 def create_context_injector(company_profile: CompanyProfile) -> ContextInjector:
@@ -8,7 +8,23 @@ Custom tools for the multi-agent research system:
 - Web scraping tools
 """
 
-from .plot_tools import GeneratePlotTool
-from .pdf_tools import CreatePDFReportTool
+import importlib
 
-__all__ = ['GeneratePlotTool', 'CreatePDFReportTool'] 
\ No newline at end of file
+# Tools are imported on first access (PEP 562): matplotlib and fpdf are only
+# loaded by code that actually uses the corresponding tool
+_TOOL_MODULES = {
+    'GeneratePlotTool': '.plot_tools',
+    'GeneratePlotBatchTool': '.plot_tools',
+    'CreatePDFReportTool': '.pdf_tools'
+}
+
+__all__ = ['GeneratePlotTool', 'GeneratePlotBatchTool', 'CreatePDFReportTool']
+
+
+def __getattr__(name):
+    module = _TOOL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value 
\ No newline at end of file
@@ -5,13 +5,22 @@ PDF Tools Module
 Custom tools for creating PDF reports for the multi-agent research system.
 """
 
-from typing import Type, List
+import io
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Type, List
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+from PIL import Image
 import os
 
 
+# Largest image size embedded (pixels): ~150 DPI across the 190mm image width
+MAX_IMAGE_SIZE = (1200, 1200)
+
+
 class PDFInput(BaseModel):
     """Input schema for the PDF report creation tool"""
     report_text_file: str = Field(
@@ -26,7 +35,8 @@ class PDFInput(BaseModel):
     )
     output_pdf_filename: str = Field(
         ...,
-        description="""The desired filename for the PDF report (e.g., 'Executive_Summary_Report.pdf')"""
+        description="""The desired filename for the PDF report (e.g., 'Executive_Summary_Report.pdf'),
+                     or an s3://bucket/key URL to upload it without writing a local file"""
     )
     title_text: str = Field(
         ...,
@@ -48,6 +58,32 @@ class CreatePDFReportTool(BaseTool):
     )
     args_schema: Type[BaseModel] = PDFInput
     
+    @staticmethod
+    def _write_paragraphs(pdf: FPDF, report_text_file: str) -> None:
+        """
+        Stream the report text into the PDF one paragraph at a time.
+        
+        Only the current paragraph is held in memory and wrapped, instead of
+        the whole file; blank lines keep their original spacing.
+        
+        Args:
+            pdf: Document being assembled
+            report_text_file: Path to the text content file
+        """
+        paragraph = []
+        with open(report_text_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if line.strip():
+                    paragraph.append(line)
+                    continue
+                if paragraph:
+                    pdf.multi_cell(0, 8, text='\n'.join(paragraph))
+                    paragraph = []
+                pdf.ln(8)
+        if paragraph:
+            pdf.multi_cell(0, 8, text='\n'.join(paragraph))
+    
     def _run(self, report_text_file: str, image_paths: List[str],
              output_pdf_filename: str, title_text: str) -> str:
         """
@@ -63,48 +99,136 @@ class CreatePDFReportTool(BaseTool):
             Success message with file path or error message
         """
         try:
-            output_dir = "output/reports"
-            os.makedirs(output_dir, exist_ok=True)
-            output_pdf_path = os.path.join(output_dir, output_pdf_filename)
+            upload = output_pdf_filename.startswith('s3://')
+            if not upload:
+                output_dir = "output/reports"
+                os.makedirs(output_dir, exist_ok=True)
+                output_pdf_path = os.path.join(output_dir, output_pdf_filename)
 
             pdf = FPDF()
             pdf.set_auto_page_break(auto=True, margin=15)
             pdf.add_page()
             
             # Add title
-            pdf.set_font("Arial", size=24)
-            pdf.cell(0, 20, title_text, ln=True, align='C')
+            pdf.set_font("Helvetica", size=24)
+            pdf.cell(0, 20, title_text, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
             pdf.ln(10)
 
             # Add text content
-            pdf.set_font("Arial", size=12)
+            pdf.set_font("Helvetica", size=12)
             if os.path.exists(report_text_file):
-                with open(report_text_file, 'r', encoding='utf-8') as f:
-                    report_content = f.read()
-                    pdf.multi_cell(0, 8, txt=report_content)
+                try:
+                    self._write_paragraphs(pdf, report_text_file)
+                except UnicodeDecodeError as decode_error:
+                    pdf.multi_cell(0, 8, text=f"Warning: Could not decode report text file {report_text_file}: {decode_error}")
                 pdf.ln(10)
             else:
-                pdf.multi_cell(0, 8, txt=f"Warning: Report text file not found at {report_text_file}")
+                pdf.multi_cell(0, 8, text=f"Warning: Report text file not found at {report_text_file}")
 
             # Add images
-            image_counter = 0
+            valid_paths = []
             for img_path in image_paths:
-                if os.path.exists(img_path):
-                    image_counter += 1
-                    pdf.add_page()  # New page for each image
-                    pdf.set_font("Arial", size=10)
-                    pdf.cell(0, 10, f"Figure {image_counter}: {os.path.basename(img_path)}", ln=True, align='C')
-                    pdf.ln(5)
-                    
-                    # Add image (centered, scaled to fit page)
-                    try:
-                        pdf.image(img_path, x=10, y=30, w=190)
-                    except Exception as img_error:
-                        pdf.multi_cell(0, 8, txt=f"Error loading image {img_path}: {img_error}")
-                else:
+                # One stat per image: missing, unreadable and empty files are skipped
+                try:
+                    img_size = os.stat(img_path).st_size
+                except OSError:
                     print(f"Warning: Image file not found at {img_path}. Skipping.")
+                    continue
+                if img_size == 0:
+                    print(f"Warning: Image file is empty at {img_path}. Skipping.")
+                    continue
+                valid_paths.append(img_path)
+            
+            # Decode and downscale every image concurrently before layout
+            with ThreadPoolExecutor() as pool:
+                images = list(pool.map(self._load_image, valid_paths))
+            
+            for image_counter, (img_path, image) in enumerate(zip(valid_paths, images), start=1):
+                pdf.add_page()  # New page for each image
+                pdf.set_font("Helvetica", size=10)
+                pdf.cell(0, 10, f"Figure {image_counter}: {os.path.basename(img_path)}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+                pdf.ln(5)
+                
+                # Add image (centered, scaled to fit page)
+                try:
+                    if isinstance(image, Exception):
+                        raise image
+                    pdf.image(image, x=10, y=30, w=190)
+                except Exception as img_error:
+                    pdf.multi_cell(0, 8, text=f"Error loading image {img_path}: {img_error}")
 
+            if upload:
+                return self._upload_pdf(pdf, output_pdf_filename)
             pdf.output(output_pdf_path)
             return f"PDF report successfully created at: {output_pdf_path}"
         except Exception as e:
-            return f"Failed to create PDF report: {e}" 
\ No newline at end of file
+            return f"Failed to create PDF report: {e}" 
+    
+    @staticmethod
+    def _load_image(img_path: str) -> Any:
+        """
+        Load an image, shrunk to at most MAX_IMAGE_SIZE.
+        
+        Oversized charts would otherwise be decoded and embedded at full
+        resolution only to be scaled down to the page width.
+        
+        Args:
+            img_path: Path to the image
+            
+        Returns:
+            PIL image, or the exception raised while loading it
+        """
+        try:
+            with Image.open(img_path) as image:
+                image.thumbnail(MAX_IMAGE_SIZE, Image.LANCZOS)
+                # Detach from the file, which is closed on leaving the block
+                return image.copy()
+        except Exception as e:
+            return e
+    
+    @staticmethod
+    def _upload_pdf(pdf: FPDF, url: str) -> str:
+        """
+        Upload the rendered PDF straight from memory to S3.
+        
+        Args:
+            pdf: Finished document
+            url: Destination as s3://bucket/key
+            
+        Returns:
+            Success message with the URL or error message
+        """
+        try:
+            import boto3
+        except ImportError:
+            return "Failed to create PDF report: uploading to s3:// requires boto3"
+        
+        bucket, _, key = url[len('s3://'):].partition('/')
+        if not bucket or not key:
+            return f"Failed to create PDF report: invalid S3 URL {url}"
+        
+        boto3.client('s3').upload_fileobj(io.BytesIO(pdf.output()), bucket, key)
+        return f"PDF report successfully uploaded to: {url}"
+    
+    async def _arun(self, report_text_file: str, image_paths: List[str],
+                    output_pdf_filename: str, title_text: str) -> str:
+        """
+        Create the PDF report without blocking the event loop.
+        
+        PDF assembly is file I/O bound, so it runs on a worker thread and
+        async crews can keep other tasks (e.g. chart rendering) going.
+        
+        Args:
+            report_text_file: Path to the text content file
+            image_paths: List of paths to chart images
+            output_pdf_filename: Name of the output PDF file
+            title_text: Title for the PDF report
+            
+        Returns:
+            Success message with file path or error message
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            lambda: self._run(report_text_file, image_paths, output_pdf_filename, title_text)
+        )
@@ -9,6 +9,7 @@ This script tests the complete CrewAI integration with the new LLM approach.
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add the project root to the path
@@ -107,14 +108,22 @@ def test_agent_creation():
             ("Nexus", create_nexus_agent)
         ]
         
-        for name, creator in agent_creators:
+        def create(creator):
             try:
-                agent = creator()
-                agents.append(agent)
-                print(f"✅ Created {name} agent")
+                return creator(), None
             except Exception as e:
-                print(f"❌ Failed to create {name} agent: {e}")
+                return None, e
+        
+        # Agents are independent, so build them (and bind their LLMs) concurrently
+        with ThreadPoolExecutor(max_workers=len(agent_creators)) as pool:
+            created = list(pool.map(lambda item: create(item[1]), agent_creators))
+        
+        for (name, _), (agent, error) in zip(agent_creators, created):
+            if error is not None:
+                print(f"❌ Failed to create {name} agent: {error}")
                 return False
+            agents.append(agent)
+            print(f"✅ Created {name} agent")
         
         print(f"✅ Successfully created {len(agents)} agents")
         return True
@@ -219,25 +228,20 @@ def main():
     print("🎯 Enhanced End-to-End Test with CrewAI Integration")
     print("=" * 60)
     
-    results = {}
-    
-    # Test 1: Basic connection
-    results["Basic Connection"] = test_basic_connection()
-    
-    # Test 2: CrewAI LLM integration
-    results["CrewAI LLM Integration"] = test_crewai_llm_integration()
+    tests = [
+        ("Basic Connection", test_basic_connection),
+        ("CrewAI LLM Integration", test_crewai_llm_integration),
+        ("Fallback Approach", test_fallback_approach),
+        ("Agent Creation", test_agent_creation),
+        ("Task Creation", test_task_creation),
+        ("Crew Creation", test_crew_creation)
+    ]
     
-    # Test 3: Fallback approach
-    results["Fallback Approach"] = test_fallback_approach()
-    
-    # Test 4: Agent creation
-    results["Agent Creation"] = test_agent_creation()
-    
-    # Test 5: Task creation
-    results["Task Creation"] = test_task_creation()
-    
-    # Test 6: Crew creation
-    results["Crew Creation"] = test_crew_creation()
+    # Run the checks one at a time: they share the agent registry and LLMs,
+    # and some start threads of their own that print
+    results = {}
+    for test_name, test in tests:
+        results[test_name] = test()
     
     # Save results
     save_test_results(results)
@@ -19,7 +19,7 @@ def test_llm_directly():
     print("🤖 Testing LLM Directly...")
     
     try:
-        from src.llm.colab_mistral_llm import ColabMistralLLM
+        from src.llm.colab_mistral_llm import ColabMistralLLM, GenerationError
         
         llm = ColabMistralLLM()
         
@@ -30,6 +30,9 @@ def test_llm_directly():
         # Test generation
         prompt = "Identify the top 3 market segments in enterprise LLM industry. Provide a brief overview of each."
         result = llm.generate(prompt, max_tokens=200)
+        if isinstance(result, GenerationError):
+            print(f"❌ Generation test failed: {result.message}")
+            return False
         print(f"✅ Generation test: {result[:100]}...")
         
         return True
@@ -92,7 +95,7 @@ def test_task_execution_simulation():
             print(f"\n🔄 Executing Task {i}: {task['name']} (Agent: {task['agent']})")
             
             # Execute task
-            result = llm.generate(task['prompt'], max_tokens=300)
+            result = str(llm.generate(task['prompt'], max_tokens=300))
             results.append({
                 "task": task['name'],
                 "agent": task['agent'],